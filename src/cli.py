@@ -1,58 +1,134 @@
 """Command-line interface for Clubhouse-Podcast-Automation."""
 
+import functools
+import hashlib
 import os
+import pickle
 import sys
+import types
 from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
-from dotenv import load_dotenv
 
-from .core.downloader import download_clubhouse_video, DownloadError
-from .core.audio_extractor import extract_audio, AudioExtractionError
-from .core.transcriber import transcribe_audio, transcribe_audio_chunked, TranscriptionError
-from .core.summarizer import generate_descriptions, SummaryError
+# Heavy modules (yaml, requests, google.generativeai via the core modules) are
+# imported lazily inside each command so that invocations which don't need
+# them (e.g. `--help`, `download`) don't pay their import cost.
+
+# Load environment variables (skip the dotenv import entirely when no .env)
+if Path(".env").exists():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+# Defaults used when no config file exists; frozen so every caller shares
+# one object instead of rebuilding the dict per invocation
+_DEFAULT_CONFIG = types.MappingProxyType(
+    {
+        "mode": "local",
+        "local": {
+            "output_dir": "./output",
+            "ffmpeg_path": "ffmpeg",
+        },
+        "transcription": {
+            "language": "en",
+            "include_timestamps": False,
+        },
+        "summary": {
+            "youtube_max_length": 5000,
+            "spotify_max_length": 4000,
+            "generate_tags": True,
+            "max_tags": 10,
+        },
+    }
+)
+
 
+def _config_cache_path(path_str: str, mtime_ns: int, size: int) -> Path:
+    """Return the on-disk cache location for a parsed config file.
 
-# Load environment variables
-load_dotenv()
+    The key includes the file's mtime and size, so editing the config
+    invalidates the cache automatically.
+    """
+    key = hashlib.sha1(f"{path_str}:{mtime_ns}:{size}".encode()).hexdigest()
+    return Path.home() / ".cache" / "clubhouse-podcast" / f"config-{key}.pkl"
 
 
 def load_config(config_path: Optional[Path] = None) -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file.
+
+    Parsed configs are memoized in-process and cached on disk as pickles,
+    both keyed on (path, mtime, size), so repeated invocations in one
+    process don't even stat the pickle and cold starts skip the YAML
+    parse. The C loader is used when PyYAML was built against libyaml.
+    """
     if config_path is None:
         config_path = Path("config/config.yaml")
 
     if not config_path.exists():
-        # Return defaults if no config file
-        return {
-            "mode": "local",
-            "local": {
-                "output_dir": "./output",
-                "ffmpeg_path": "ffmpeg",
-            },
-            "transcription": {
-                "language": "en",
-                "include_timestamps": False,
-            },
-            "summary": {
-                "youtube_max_length": 5000,
-                "spotify_max_length": 4000,
-                "generate_tags": True,
-                "max_tags": 10,
-            },
-        }
-
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+        return _DEFAULT_CONFIG
+
+    st = config_path.stat()
+    return _load_config_cached(str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse (or load the pickled form of) one config file version."""
+    cache_path = _config_cache_path(path_str, mtime_ns, size)
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Corrupt or unreadable cache; fall through and re-parse
+
+    import yaml
+
+    with open(path_str) as f:
+        config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(config, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache is best-effort; a read-only home dir shouldn't break the CLI
+
+    return config
+
+
+def _dump_yaml(data: dict, output_path: Path) -> None:
+    """Write a dict as YAML through the C dumper when libyaml is available."""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    with open(output_path, "wb") as f:
+        yaml.dump(
+            data,
+            f,
+            Dumper=dumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+            encoding="utf-8",
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_key() -> Optional[str]:
+    """Read GEMINI_API_KEY once per invocation (os.environ.get allocates per call)."""
+    return os.environ.get("GEMINI_API_KEY")
 
 
 @click.group()
 @click.option(
     "--config",
     "-c",
-    type=click.Path(exists=True),
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
     help="Path to config file",
 )
 @click.pass_context
@@ -62,19 +138,22 @@ def cli(ctx, config):
     Automate publishing Clubhouse recordings to Spotify and YouTube.
     """
     ctx.ensure_object(dict)
-    config_path = Path(config) if config else None
-    ctx.obj["config"] = load_config(config_path)
+    ctx.obj["config"] = load_config(config)
+    # Re-read the environment once per invocation; subcommands share the cache.
+    _gemini_key.cache_clear()
 
 
 @cli.command()
 @click.option("--url", "-u", required=True, help="Clubhouse recording URL")
-@click.option("--output", "-o", type=click.Path(), help="Output directory")
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Output directory")
 @click.option("--filename", "-f", help="Custom filename (without extension)")
 @click.pass_context
 def download(ctx, url, output, filename):
     """Download a Clubhouse recording."""
+    from .core.downloader import download_clubhouse_video, DownloadError
+
     config = ctx.obj["config"]
-    output_dir = Path(output) if output else Path(config["local"]["output_dir"]) / "audio"
+    output_dir = output if output else Path(config["local"]["output_dir"]) / "audio"
 
     click.echo(f"Downloading from: {url}")
 
@@ -91,23 +170,31 @@ def download(ctx, url, output, filename):
 
 
 @cli.command()
-@click.option("--input", "-i", "input_path", required=True, type=click.Path(exists=True), help="Input video file")
-@click.option("--output", "-o", type=click.Path(), help="Output audio file")
+@click.option("--input", "-i", "input_path", required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path), help="Input video file")
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Output audio file")
+@click.option(
+    "--copy/--reencode",
+    "prefer_copy",
+    default=True,
+    help="Stream-copy compatible audio instead of re-encoding to MP3 (default: copy)",
+)
 @click.pass_context
-def extract(ctx, input_path, output):
+def extract(ctx, input_path, output, prefer_copy):
     """Extract audio from video file."""
+    from .core.audio_extractor import extract_audio, AudioExtractionError
+
     config = ctx.obj["config"]
     ffmpeg_path = config["local"].get("ffmpeg_path", "ffmpeg")
 
     click.echo(f"Extracting audio from: {input_path}")
 
     try:
-        output_path = Path(output) if output else None
         result = extract_audio(
-            video_path=Path(input_path),
-            output_path=output_path,
+            video_path=input_path,
+            output_path=output,
             ffmpeg_path=ffmpeg_path,
             overwrite=True,
+            prefer_copy=prefer_copy,
         )
         click.echo(f"Extracted to: {result}")
     except (FileNotFoundError, AudioExtractionError) as e:
@@ -116,18 +203,22 @@ def extract(ctx, input_path, output):
 
 
 @cli.command()
-@click.option("--input", "-i", "input_path", required=True, type=click.Path(exists=True), help="Input audio file")
-@click.option("--output", "-o", type=click.Path(), help="Output transcript file")
+@click.option("--input", "-i", "input_path", required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path), help="Input audio file")
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Output transcript file")
 @click.option("--language", "-l", default="en", help="Language code: en, yue, zh, zh-HK, zh-TW, ja, ko, etc. (default: en)")
 @click.option("--timestamps", "-t", is_flag=True, help="Include timestamps in transcript")
 @click.option("--chunked", is_flag=True, help="Use chunked transcription for long audio files")
 @click.option("--chunk-minutes", default=10, type=int, help="Chunk duration in minutes (default: 10)")
+@click.option("--align-silence", is_flag=True, help="Snap chunk boundaries to pauses (chunked mode only)")
+@click.option("--stream-output", is_flag=True, help="Print the transcript as it is generated (non-chunked mode)")
 @click.option("--model", "-m", default="gemini-2.5-flash", help="Gemini model to use (default: gemini-2.5-flash)")
 @click.pass_context
-def transcribe(ctx, input_path, output, language, timestamps, chunked, chunk_minutes, model):
+def transcribe(ctx, input_path, output, language, timestamps, chunked, chunk_minutes, align_silence, stream_output, model):
     """Transcribe audio file using Gemini API."""
+    from .core.transcriber import transcribe_audio, transcribe_audio_chunked, TranscriptionError
+
     config = ctx.obj["config"]
-    api_key = os.environ.get("GEMINI_API_KEY")
+    api_key = _gemini_key()
 
     if not api_key:
         click.echo("Error: GEMINI_API_KEY environment variable not set", err=True)
@@ -140,30 +231,32 @@ def transcribe(ctx, input_path, output, language, timestamps, chunked, chunk_min
         if chunked:
             click.echo(f"Using chunked transcription ({chunk_minutes} min chunks)...")
             transcript = transcribe_audio_chunked(
-                audio_path=Path(input_path),
+                audio_path=input_path,
                 api_key=api_key,
                 language=language,
                 chunk_duration_minutes=chunk_minutes,
                 include_timestamps=timestamps,
                 model_name=model,
                 show_progress=True,
+                align_to_silence=align_silence,
             )
         else:
             transcript = transcribe_audio(
-                audio_path=Path(input_path),
+                audio_path=input_path,
                 api_key=api_key,
                 language=language,
                 include_timestamps=timestamps or config.get("transcription", {}).get("include_timestamps", False),
                 model_name=model,
+                stream_response=stream_output,
             )
 
         # Save transcript
         if output:
-            output_path = Path(output)
+            output_path = output
         else:
             output_dir = Path(config["local"]["output_dir"]) / "transcripts"
             output_dir.mkdir(parents=True, exist_ok=True)
-            output_path = output_dir / f"{Path(input_path).stem}_transcript.txt"
+            output_path = output_dir / f"{input_path.stem}_transcript.txt"
 
         output_path.write_text(transcript)
         click.echo(f"Transcript saved to: {output_path}")
@@ -174,14 +267,16 @@ def transcribe(ctx, input_path, output, language, timestamps, chunked, chunk_min
 
 
 @cli.command()
-@click.option("--input", "-i", "input_path", required=True, type=click.Path(exists=True), help="Input transcript file")
+@click.option("--input", "-i", "input_path", required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path), help="Input transcript file")
 @click.option("--title", "-t", required=True, help="Episode title")
-@click.option("--output", "-o", type=click.Path(), help="Output directory for descriptions")
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Output directory for descriptions")
 @click.pass_context
 def summarize(ctx, input_path, title, output):
     """Generate descriptions from transcript using Gemini API."""
+    from .core.summarizer import generate_descriptions, SummaryError
+
     config = ctx.obj["config"]
-    api_key = os.environ.get("GEMINI_API_KEY")
+    api_key = _gemini_key()
 
     if not api_key:
         click.echo("Error: GEMINI_API_KEY environment variable not set", err=True)
@@ -190,7 +285,10 @@ def summarize(ctx, input_path, title, output):
     click.echo(f"Generating descriptions for: {title}")
 
     try:
-        transcript = Path(input_path).read_text()
+        # Only a prefix of the transcript ever reaches the model, so read
+        # just that much instead of buffering a multi-MB file to slice it.
+        with open(input_path, "rb") as f:
+            transcript = f.read(64 * 1024).decode("utf-8", errors="replace")
         summary_config = config.get("summary", {})
 
         descriptions = generate_descriptions(
@@ -205,16 +303,15 @@ def summarize(ctx, input_path, title, output):
 
         # Save descriptions
         if output:
-            output_dir = Path(output)
+            output_dir = output
         else:
             output_dir = Path(config["local"]["output_dir"]) / "descriptions"
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Save as YAML for easy reading
-        output_path = output_dir / f"{Path(input_path).stem}_descriptions.yaml"
-        with open(output_path, "w") as f:
-            yaml.dump(descriptions, f, default_flow_style=False, allow_unicode=True)
+        output_path = output_dir / f"{input_path.stem}_descriptions.yaml"
+        _dump_yaml(descriptions, output_path)
 
         click.echo(f"Descriptions saved to: {output_path}")
         click.echo(f"\nYouTube Title: {descriptions['youtube_title']}")
@@ -228,48 +325,79 @@ def summarize(ctx, input_path, title, output):
 @cli.command()
 @click.option("--url", "-u", required=True, help="Clubhouse recording URL")
 @click.option("--title", "-t", required=True, help="Episode title")
-@click.option("--output", "-o", type=click.Path(), help="Output directory")
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Output directory")
+@click.option(
+    "--stream/--no-stream",
+    "stream",
+    default=False,
+    help="Pipe the download straight into ffmpeg so download and extraction "
+    "overlap (requires a faststart MP4; falls back automatically)",
+)
 @click.pass_context
-def process(ctx, url, title, output):
+def process(ctx, url, title, output, stream):
     """Run the full processing pipeline (download -> extract -> transcribe -> summarize)."""
+    from .core.downloader import DownloadError
+    from .core.audio_extractor import AudioExtractionError
+    from .core.transcriber import TranscriptionError
+    from .core.summarizer import SummaryError
+    from .core.pipeline import build_pipeline
+
     config = ctx.obj["config"]
-    api_key = os.environ.get("GEMINI_API_KEY")
+    api_key = _gemini_key()
 
     if not api_key:
         click.echo("Error: GEMINI_API_KEY environment variable not set", err=True)
         sys.exit(1)
 
-    output_base = Path(output) if output else Path(config["local"]["output_dir"])
+    # Bind config into the pipeline stages once; a broken config fails
+    # here, before any network or ffmpeg work.
+    try:
+        pipe = build_pipeline(config, api_key)
+    except ValueError as e:
+        click.echo(f"Config error: {e}", err=True)
+        sys.exit(1)
+
+    local_config = config["local"]
+
+    output_base = output if output else Path(local_config["output_dir"])
 
     click.echo(f"Processing: {title}")
     click.echo("=" * 50)
 
     try:
-        # Step 1: Download
-        click.echo("\n[1/4] Downloading video...")
         audio_dir = output_base / "audio"
-        video_path = download_clubhouse_video(
-            url=url,
-            output_dir=audio_dir,
-        )
-        click.echo(f"      Downloaded: {video_path}")
 
-        # Step 2: Extract audio
-        click.echo("\n[2/4] Extracting audio...")
-        audio_path = extract_audio(
-            video_path=video_path,
-            ffmpeg_path=config["local"].get("ffmpeg_path", "ffmpeg"),
-            overwrite=True,
-        )
-        click.echo(f"      Extracted: {audio_path}")
+        if stream:
+            # Steps 1+2 fused: the download is piped straight into ffmpeg.
+            from .core.pipeline import download_and_extract_audio
+
+            click.echo("\n[1/4] Downloading video...")
+            click.echo("\n[2/4] Extracting audio (streaming)...")
+            video_path, audio_path = download_and_extract_audio(
+                url=url,
+                output_dir=audio_dir,
+                ffmpeg_path=local_config.get("ffmpeg_path", "ffmpeg"),
+            )
+            if video_path is None:
+                video_path = "(streamed, no video file kept)"
+            click.echo(f"      Extracted: {audio_path}")
+        else:
+            # Step 1: Download
+            click.echo("\n[1/4] Downloading video...")
+            video_path = pipe.download(
+                url=url,
+                output_dir=audio_dir,
+            )
+            click.echo(f"      Downloaded: {video_path}")
+
+            # Step 2: Extract audio
+            click.echo("\n[2/4] Extracting audio...")
+            audio_path = pipe.extract(video_path=video_path)
+            click.echo(f"      Extracted: {audio_path}")
 
         # Step 3: Transcribe
         click.echo("\n[3/4] Transcribing audio...")
-        transcript = transcribe_audio(
-            audio_path=audio_path,
-            api_key=api_key,
-            language=config.get("transcription", {}).get("language", "en"),
-        )
+        transcript = pipe.transcribe(audio_path=audio_path)
 
         transcript_dir = output_base / "transcripts"
         transcript_dir.mkdir(parents=True, exist_ok=True)
@@ -279,22 +407,15 @@ def process(ctx, url, title, output):
 
         # Step 4: Generate descriptions
         click.echo("\n[4/4] Generating descriptions...")
-        summary_config = config.get("summary", {})
-        descriptions = generate_descriptions(
+        descriptions = pipe.summarize(
             transcript=transcript,
             episode_title=title,
-            api_key=api_key,
-            youtube_max_length=summary_config.get("youtube_max_length", 5000),
-            spotify_max_length=summary_config.get("spotify_max_length", 4000),
-            generate_tags=summary_config.get("generate_tags", True),
-            max_tags=summary_config.get("max_tags", 10),
         )
 
         desc_dir = output_base / "descriptions"
         desc_dir.mkdir(parents=True, exist_ok=True)
         desc_path = desc_dir / f"{audio_path.stem}_descriptions.yaml"
-        with open(desc_path, "w") as f:
-            yaml.dump(descriptions, f, default_flow_style=False, allow_unicode=True)
+        _dump_yaml(descriptions, desc_path)
         click.echo(f"      Descriptions: {desc_path}")
 
         # Summary
@@ -322,8 +443,226 @@ def process(ctx, url, title, output):
         sys.exit(1)
 
 
+_DEFAULT_DAEMON_SOCKET = "/tmp/clubhouse-podcast.sock"
+
+# How long the daemon waits for a connected client to finish sending its
+# request before giving up on that connection
+_DAEMON_CONN_TIMEOUT = 30
+
+# Argv sentinel a client sends to shut the daemon down
+_DAEMON_STOP = ["__stop__"]
+
+# Commands that manage the daemon itself; they must always run in-process
+# (a daemon executing serve inside its own handler would bind a second
+# socket and block its accept loop on the nested idle timeout)
+_DAEMON_LOCAL_COMMANDS = frozenset({"serve", "stop"})
+
+# Sent by the daemon as soon as it has accepted a request, before the
+# command runs. Lets clients bound their wait for a responsive daemon
+# without capping how long a legitimate command may take.
+_DAEMON_ACK = b"\x06"
+_DAEMON_ACK_TIMEOUT = 5
+
+
+def _recv_all(conn) -> bytes:
+    """Read from a socket until EOF."""
+    chunks = []
+    while True:
+        block = conn.recv(65536)
+        if not block:
+            return b"".join(chunks)
+        chunks.append(block)
+
+
+@cli.command()
+@click.option(
+    "--socket", "-s", "socket_path",
+    default=_DEFAULT_DAEMON_SOCKET,
+    help=f"Unix socket path (default: {_DEFAULT_DAEMON_SOCKET})",
+)
+@click.option(
+    "--idle-timeout",
+    default=300,
+    type=int,
+    help="Exit after this many seconds without a request (0 disables)",
+)
+def serve(socket_path, idle_timeout):
+    """Run a daemon that keeps a warm interpreter for fast CLI calls.
+
+    Set CLUBHOUSE_DAEMON_SOCKET to the socket path and subsequent podcast
+    invocations are forwarded here, skipping interpreter and library
+    startup (the gRPC/protobuf import alone costs hundreds of ms).
+    """
+    import contextlib
+    import io
+    import pickle
+    import socket as socketlib
+
+    path = Path(socket_path)
+    if path.exists():
+        path.unlink()
+
+    server = socketlib.socket(socketlib.AF_UNIX, socketlib.SOCK_STREAM)
+    server.bind(str(path))
+    os.chmod(path, 0o600)  # Only this user may drive the daemon
+    server.listen()
+    server.settimeout(idle_timeout if idle_timeout > 0 else None)
+    click.echo(f"Daemon listening on {path} (idle timeout: {idle_timeout}s)")
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socketlib.timeout:
+                click.echo("Idle timeout reached, exiting")
+                break
+
+            with conn:
+                # One stalled or vanished client must not take the daemon
+                # with it: bound the request read and swallow socket errors
+                # around the reply.
+                conn.settimeout(_DAEMON_CONN_TIMEOUT)
+                try:
+                    argv, cwd = pickle.loads(_recv_all(conn))
+                except Exception:
+                    continue  # Malformed, stalled, or disconnected client
+
+                # Acknowledge receipt before executing so clients can tell
+                # "command running" apart from a stalled daemon.
+                try:
+                    conn.sendall(_DAEMON_ACK)
+                except OSError:
+                    continue
+
+                if argv == _DAEMON_STOP:
+                    try:
+                        conn.sendall(pickle.dumps((0, "Daemon stopped\n")))
+                    except OSError:
+                        pass
+                    break
+
+                if _DAEMON_LOCAL_COMMANDS.intersection(argv):
+                    # Never nest daemon management inside the handler
+                    try:
+                        conn.sendall(
+                            pickle.dumps(
+                                (1, "Error: serve/stop cannot run inside the daemon\n")
+                            )
+                        )
+                    except OSError:
+                        pass
+                    continue
+
+                buf = io.StringIO()
+                code = 0
+                prev_cwd = os.getcwd()
+                try:
+                    os.chdir(cwd)
+                    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+                        cli(args=argv, standalone_mode=False, obj={})
+                except SystemExit as e:
+                    if e.code is None:
+                        code = 0
+                    else:
+                        code = e.code if isinstance(e.code, int) else 1
+                except click.ClickException as e:
+                    buf.write(f"Error: {e.format_message()}\n")
+                    code = e.exit_code
+                except click.Abort:
+                    buf.write("Aborted!\n")
+                    code = 1
+                except Exception as e:
+                    buf.write(f"Error: {e}\n")
+                    code = 1
+                finally:
+                    os.chdir(prev_cwd)
+
+                try:
+                    conn.sendall(pickle.dumps((code, buf.getvalue())))
+                except OSError:
+                    pass  # Client went away before reading the reply
+    finally:
+        server.close()
+        if path.exists():
+            path.unlink()
+
+
+@cli.command()
+@click.option(
+    "--socket", "-s", "socket_path",
+    default=_DEFAULT_DAEMON_SOCKET,
+    help=f"Unix socket path (default: {_DEFAULT_DAEMON_SOCKET})",
+)
+def stop(socket_path):
+    """Stop a running daemon."""
+    import pickle
+    import socket as socketlib
+
+    client = socketlib.socket(socketlib.AF_UNIX, socketlib.SOCK_STREAM)
+    client.settimeout(_DAEMON_ACK_TIMEOUT)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        click.echo(f"No daemon running at {socket_path}", err=True)
+        sys.exit(1)
+
+    with client:
+        try:
+            client.sendall(pickle.dumps((_DAEMON_STOP, os.getcwd())))
+            client.shutdown(socketlib.SHUT_WR)
+            _recv_all(client)
+        except OSError:
+            click.echo("Daemon did not respond; it may be stuck", err=True)
+            sys.exit(1)
+    click.echo("Daemon stopped")
+
+
+def _forward_to_daemon(socket_path: str) -> Optional[int]:
+    """
+    Forward this invocation to a running daemon.
+
+    Returns the exit code, or None when no daemon is reachable (the
+    caller then runs the command in-process as usual).
+    """
+    import pickle
+    import socket as socketlib
+
+    client = socketlib.socket(socketlib.AF_UNIX, socketlib.SOCK_STREAM)
+    # Bounded wait until the daemon acknowledges the request; a stalled or
+    # wedged daemon means falling back to in-process execution instead of
+    # hanging the CLI.
+    client.settimeout(_DAEMON_ACK_TIMEOUT)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        return None
+
+    with client:
+        try:
+            client.sendall(pickle.dumps((sys.argv[1:], os.getcwd())))
+            client.shutdown(socketlib.SHUT_WR)
+            if client.recv(1) != _DAEMON_ACK:
+                return None
+            # The daemon is executing the command now; replies may take as
+            # long as the command itself.
+            client.settimeout(None)
+            code, output = pickle.loads(_recv_all(client))
+        except Exception:
+            return None
+
+    sys.stdout.write(output)
+    return code
+
+
 def main():
     """Entry point for the CLI."""
+    daemon_socket = os.environ.get("CLUBHOUSE_DAEMON_SOCKET")
+    # serve/stop run in-process wherever they appear on the command line
+    # (group options like -c may precede the subcommand).
+    if daemon_socket and not _DAEMON_LOCAL_COMMANDS.intersection(sys.argv[1:]):
+        code = _forward_to_daemon(daemon_socket)
+        if code is not None:
+            sys.exit(code)
     cli(obj={})
 
 
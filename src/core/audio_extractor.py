@@ -1,7 +1,10 @@
 """Extract audio tracks from video files using ffmpeg."""
 
+import collections
+import functools
 import subprocess
 import shutil
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -12,16 +15,24 @@ class AudioExtractionError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=8)
 def check_ffmpeg(ffmpeg_path: str = "ffmpeg") -> bool:
     """
     Check if ffmpeg is available.
 
+    The result is cached per path: binary availability doesn't change
+    within a process lifetime, and the probe costs a subprocess spawn.
+
     Args:
         ffmpeg_path: Path to ffmpeg binary
 
     Returns:
         True if ffmpeg is available, False otherwise
     """
+    # PATH lookup first: avoids the subprocess entirely for missing binaries
+    if shutil.which(ffmpeg_path) is None:
+        return False
+
     try:
         result = subprocess.run(
             [ffmpeg_path, "-version"],
@@ -73,6 +84,48 @@ def get_audio_duration(audio_path: Path, ffmpeg_path: str = "ffmpeg") -> float:
         raise AudioExtractionError(f"Failed to get audio duration: {e}")
 
 
+def _probe_audio_codec(video_path: Path, ffmpeg_path: str = "ffmpeg") -> Optional[str]:
+    """
+    Probe the codec of the first audio stream in a video file.
+
+    Args:
+        video_path: Path to video file
+        ffmpeg_path: Path to ffmpeg binary (ffprobe is derived from it)
+
+    Returns:
+        Codec name (e.g. "aac", "mp3"), or None if probing fails
+    """
+    ffprobe_path = ffmpeg_path.replace("ffmpeg", "ffprobe")
+
+    try:
+        result = subprocess.run(
+            [
+                ffprobe_path,
+                "-v", "error",
+                "-select_streams", "a:0",
+                "-show_entries", "stream=codec_name",
+                "-of", "csv=p=0",
+                str(video_path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        if result.returncode != 0:
+            return None
+
+        codec = result.stdout.strip()
+        return codec or None
+
+    except (subprocess.SubprocessError, FileNotFoundError, OSError):
+        return None
+
+
+# Codecs that can be stream-copied into an .m4a container without re-encoding
+_COPYABLE_CODECS = frozenset({"aac"})
+
+
 def extract_audio(
     video_path: Path,
     output_path: Optional[Path] = None,
@@ -80,21 +133,37 @@ def extract_audio(
     audio_codec: str = "libmp3lame",
     audio_quality: str = "2",
     overwrite: bool = False,
+    prefer_copy: bool = True,
+    return_duration: bool = False,
 ) -> Path:
     """
-    Extract audio track from video file to MP3 using ffmpeg.
+    Extract audio track from video file using ffmpeg.
+
+    When the source audio is already AAC (the codec Clubhouse MP4s ship),
+    the track is stream-copied into an .m4a container instead of being
+    re-encoded to MP3 - this turns a CPU-bound re-encode into a cheap
+    demux. Pass prefer_copy=False (or an explicit non-.m4a output_path)
+    to force the MP3 re-encode.
 
     Args:
         video_path: Path to input video file (MP4, etc.)
-        output_path: Optional output path for MP3 file.
-                     Defaults to same directory as video with .mp3 extension.
+        output_path: Optional output path for the audio file.
+                     Defaults to same directory as video with .m4a extension
+                     (stream copy) or .mp3 (re-encode).
         ffmpeg_path: Path to ffmpeg binary
-        audio_codec: Audio codec to use (default: libmp3lame for MP3)
+        audio_codec: Audio codec for the re-encode path (default: libmp3lame)
         audio_quality: Audio quality setting (0-9, lower is better)
         overwrite: Whether to overwrite existing output file
+        prefer_copy: Whether to stream-copy compatible source audio
+                     instead of re-encoding
+        return_duration: Also return the extracted duration in seconds,
+                         parsed from ffmpeg's own progress stream - no
+                         follow-up ffprobe spawn needed
 
     Returns:
-        Path to extracted MP3 file
+        Path to the extracted audio file, or (path, duration_seconds)
+        when return_duration is set (duration is None if ffmpeg didn't
+        report one)
 
     Raises:
         FileNotFoundError: If video file doesn't exist
@@ -116,9 +185,16 @@ def extract_audio(
             "Please install ffmpeg: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)"
         )
 
+    # Decide between stream copy and re-encode. Copy is only taken when the
+    # source codec supports it and the caller didn't request another format.
+    use_copy = False
+    if prefer_copy and (output_path is None or Path(output_path).suffix == ".m4a"):
+        codec = _probe_audio_codec(video_path, ffmpeg_path)
+        use_copy = codec in _COPYABLE_CODECS
+
     # Determine output path
     if output_path is None:
-        output_path = video_path.with_suffix(".mp3")
+        output_path = video_path.with_suffix(".m4a" if use_copy else ".mp3")
     else:
         output_path = Path(output_path)
 
@@ -133,27 +209,69 @@ def extract_audio(
         )
 
     # Build ffmpeg command
-    cmd = [
-        ffmpeg_path,
-        "-i", str(video_path),      # Input file
-        "-vn",                       # No video
-        "-acodec", audio_codec,      # Audio codec
-        "-q:a", audio_quality,       # Audio quality
-        "-y" if overwrite else "-n", # Overwrite flag
-        str(output_path),            # Output file
-    ]
+    if use_copy:
+        cmd = [
+            ffmpeg_path,
+            "-i", str(video_path),      # Input file
+            "-vn",                       # No video
+            "-c:a", "copy",              # Stream copy, no re-encode
+            "-movflags", "+faststart",   # Put moov atom up front
+            "-y" if overwrite else "-n", # Overwrite flag
+            str(output_path),            # Output file
+        ]
+    else:
+        cmd = [
+            ffmpeg_path,
+            "-i", str(video_path),      # Input file
+            "-vn",                       # No video
+            "-acodec", audio_codec,      # Audio codec
+            "-q:a", audio_quality,       # Audio quality
+            "-y" if overwrite else "-n", # Overwrite flag
+            str(output_path),            # Output file
+        ]
+
+    if return_duration:
+        # ffmpeg reports its own progress (including out_time_us) on the
+        # stream we're already draining; parsing it replaces the ffprobe
+        # spawn callers previously needed for the duration.
+        cmd = [cmd[0], "-progress", "pipe:2", *cmd[1:]]
 
     try:
-        result = subprocess.run(
+        # Stream stderr instead of buffering it all: a long re-encode emits
+        # tens of thousands of progress lines, and only the tail matters
+        # for diagnostics.
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=3600,  # 1 hour timeout for long videos
         )
-
-        if result.returncode != 0:
+        stderr_tail = collections.deque(maxlen=50)
+        last_out_time_us = [None]
+
+        def _drain():
+            for line in proc.stderr:
+                stderr_tail.append(line)
+                if return_duration and line.startswith("out_time_us="):
+                    try:
+                        last_out_time_us[0] = int(line.split("=", 1)[1])
+                    except ValueError:
+                        pass  # ffmpeg reports N/A before the first frame
+
+        drain_thread = threading.Thread(target=_drain, daemon=True)
+        drain_thread.start()
+
+        try:
+            returncode = proc.wait(timeout=3600)  # 1 hour timeout for long videos
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        drain_thread.join()
+
+        if returncode != 0:
             raise AudioExtractionError(
-                f"ffmpeg extraction failed (code {result.returncode}): {result.stderr}"
+                f"ffmpeg extraction failed (code {returncode}): {''.join(stderr_tail)}"
             )
 
         # Verify output file was created
@@ -162,6 +280,11 @@ def extract_audio(
                 f"ffmpeg completed but output file not found: {output_path}"
             )
 
+        if return_duration:
+            duration = (
+                last_out_time_us[0] / 1e6 if last_out_time_us[0] is not None else None
+            )
+            return output_path, duration
         return output_path
 
     except subprocess.TimeoutExpired:
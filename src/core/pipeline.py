@@ -0,0 +1,197 @@
+"""Pipeline helpers: pre-bound stages and fused network/ffmpeg passes."""
+
+import functools
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import requests
+
+from .audio_extractor import extract_audio
+from .downloader import (
+    DownloadError,
+    _SESSION,
+    _filename_from_url,
+    download_clubhouse_video,
+    validate_url,
+)
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    """The four processing stages with config-derived arguments pre-bound."""
+
+    download: Callable[..., Path]
+    extract: Callable[..., Path]
+    transcribe: Callable[..., str]
+    summarize: Callable[..., dict]
+
+
+def build_pipeline(config: dict, api_key: str) -> Pipeline:
+    """
+    Bind config values into the pipeline stages once.
+
+    Centralizes the config walking and validation so a broken config
+    fails here, before any network or ffmpeg work starts, and per-episode
+    calls are plain invocations with no dict traversal.
+
+    Args:
+        config: Parsed configuration dict
+        api_key: Gemini API key for the transcribe/summarize stages
+
+    Returns:
+        Pipeline with download/extract/transcribe/summarize callables
+
+    Raises:
+        ValueError: If required config keys are missing
+    """
+    # Late imports, and attribute access at build time rather than module
+    # load: the heavy transcriber/summarizer imports stay off the light
+    # commands, and patched-in replacements on the core modules are honored.
+    from . import audio_extractor, downloader, summarizer, transcriber
+
+    if "local" not in config or not isinstance(config["local"], dict):
+        raise ValueError("config is missing the 'local' section")
+    local_config = config["local"]
+
+    summary_config = config.get("summary", {})
+    transcription_config = config.get("transcription", {})
+
+    return Pipeline(
+        download=downloader.download_clubhouse_video,
+        extract=functools.partial(
+            audio_extractor.extract_audio,
+            ffmpeg_path=local_config.get("ffmpeg_path", "ffmpeg"),
+            overwrite=True,
+        ),
+        transcribe=functools.partial(
+            transcriber.transcribe_audio,
+            api_key=api_key,
+            language=transcription_config.get("language", "en"),
+        ),
+        summarize=functools.partial(
+            summarizer.generate_descriptions,
+            api_key=api_key,
+            youtube_max_length=summary_config.get("youtube_max_length", 5000),
+            spotify_max_length=summary_config.get("spotify_max_length", 4000),
+            generate_tags=summary_config.get("generate_tags", True),
+            max_tags=summary_config.get("max_tags", 10),
+        ),
+    )
+
+
+def _audio_filename_from_url(url: str, filename: Optional[str] = None) -> str:
+    """Derive an .m4a filename for a recording URL."""
+    if not filename:
+        filename = _filename_from_url(url)
+
+    # Swap any container extension for .m4a
+    if "." in filename:
+        filename = filename.rsplit(".", 1)[0]
+    return f"{filename}.m4a"
+
+
+def download_and_extract_audio(
+    url: str,
+    output_dir: Path,
+    ffmpeg_path: str = "ffmpeg",
+    filename: Optional[str] = None,
+    timeout: int = 3600,
+) -> Tuple[Optional[Path], Path]:
+    """
+    Download a recording and extract its audio in a single streaming pass.
+
+    The HTTP body is piped straight into ffmpeg's stdin with -c:a copy, so
+    the download and the demux overlap and no intermediate video file is
+    written. This only works when the MP4 has its moov atom up front
+    (faststart); when ffmpeg can't demux from the pipe, the function falls
+    back to the sequential download-then-extract path, which re-fetches
+    the URL.
+
+    Args:
+        url: Direct download URL for the Clubhouse recording
+        output_dir: Directory to save the extracted audio (and, on the
+                    fallback path, the downloaded video)
+        ffmpeg_path: Path to ffmpeg binary
+        filename: Optional custom filename (without extension)
+        timeout: Download timeout in seconds
+
+    Returns:
+        Tuple of (video_path, audio_path). video_path is None when the
+        streaming pass succeeded and no video file was written.
+
+    Raises:
+        ValueError: If URL is invalid
+        DownloadError: If the download fails on both paths
+        AudioExtractionError: If audio extraction fails on the fallback path
+    """
+    if not url or not validate_url(url):
+        raise ValueError(f"Invalid URL: {url}")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    audio_path = output_dir / _audio_filename_from_url(url, filename)
+
+    try:
+        response = _SESSION.get(url, stream=True, timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        raise DownloadError(f"Download failed: {e}")
+
+    response.raw.decode_content = True
+
+    proc = subprocess.Popen(
+        [
+            ffmpeg_path,
+            "-y",
+            "-i", "pipe:0",
+            "-vn",
+            "-c:a", "copy",
+            str(audio_path),
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        shutil.copyfileobj(response.raw, proc.stdin, length=1 << 20)
+        proc.stdin.close()
+        returncode = proc.wait(timeout=timeout)
+    except (OSError, subprocess.SubprocessError):
+        # ffmpeg bailed mid-stream (e.g. moov atom at the end of the file)
+        proc.kill()
+        proc.wait()
+        returncode = -1
+
+    if returncode == 0 and audio_path.exists() and audio_path.stat().st_size > 0:
+        # ffmpeg can exit 0 after a failed stdin demux (moov atom at the
+        # end of a large file) while leaving a header-only container, so
+        # a clean exit alone doesn't mean the audio made it. Probe the
+        # output's duration before trusting the streaming pass.
+        from .transcriber import TranscriptionError, get_audio_duration
+
+        try:
+            if get_audio_duration(audio_path) > 0:
+                return None, audio_path
+        except TranscriptionError:
+            pass  # Unreadable output; treat the streaming pass as failed
+
+    # Streaming demux failed; fall back to the sequential two-step path.
+    if audio_path.exists():
+        audio_path.unlink()
+
+    video_path = download_clubhouse_video(
+        url=url,
+        output_dir=output_dir,
+        filename=filename,
+        timeout=timeout,
+    )
+    extracted = extract_audio(
+        video_path=video_path,
+        ffmpeg_path=ffmpeg_path,
+        overwrite=True,
+    )
+    return video_path, extracted
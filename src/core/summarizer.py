@@ -1,9 +1,23 @@
 """Generate descriptions for YouTube and Spotify using Gemini API."""
 
 import os
+import re
 from typing import Optional, List
 
-import google.generativeai as genai
+# As in the transcriber, google.generativeai (and its gRPC/protobuf
+# stack) is imported on first API use rather than at module import.
+# Tests replace this attribute with a double.
+genai = None
+
+
+def _require_genai():
+    """Import google.generativeai on first use and return it."""
+    global genai
+    if genai is None:
+        import google.generativeai
+
+        genai = google.generativeai
+    return genai
 
 
 class SummaryError(Exception):
@@ -12,10 +26,20 @@ class SummaryError(Exception):
     pass
 
 
+# Reconfiguring the SDK and rebuilding model objects per call is wasted
+# work in batch runs; both are cached here. The live genai module object
+# is part of the key so a swapped-in test double gets fresh state.
+_configured = [None]
+_MODEL_CACHE: dict = {}
+
+
 def configure_gemini(api_key: Optional[str] = None) -> None:
     """
     Configure the Gemini API with the provided key.
 
+    genai.configure is only invoked when the key (or the genai module
+    itself) changed since the last call.
+
     Args:
         api_key: Gemini API key. If None, reads from GEMINI_API_KEY env var.
 
@@ -30,7 +54,80 @@ def configure_gemini(api_key: Optional[str] = None) -> None:
             "Set GEMINI_API_KEY environment variable or pass api_key parameter."
         )
 
-    genai.configure(api_key=key)
+    genai = _require_genai()
+    if _configured[0] != (genai, key):
+        genai.configure(api_key=key)
+        _configured[0] = (genai, key)
+
+
+def _get_model(model_name: str):
+    """Return a cached GenerativeModel for model_name."""
+    genai = _require_genai()
+    cache_key = (genai, model_name)
+    model = _MODEL_CACHE.get(cache_key)
+    if model is None:
+        model = genai.GenerativeModel(model_name)
+        _MODEL_CACHE[cache_key] = model
+    return model
+
+
+# How much of the transcript is sent to the model
+_TRANSCRIPT_PREFIX_LIMIT = 10000
+
+# Prompt template, built once at import instead of per call
+_PROMPT_TMPL = """You are a podcast content assistant. Based on the following transcript, generate content for publishing this episode.
+
+Episode Title: {episode_title}
+
+Transcript:
+{transcript}
+
+Please generate:
+
+1. YOUTUBE_TITLE: A catchy, SEO-friendly title for YouTube (max 100 characters). Keep it engaging but informative.
+
+2. YOUTUBE_DESCRIPTION: A comprehensive description for YouTube (max {youtube_max_length} characters) that includes:
+   - A brief summary of the episode (2-3 sentences)
+   - Key topics discussed (bullet points)
+   - Timestamps for major sections if identifiable
+   - A call to action to subscribe
+
+3. SPOTIFY_TITLE: The episode title for Spotify (can be same as original or slightly modified, max 100 characters)
+
+4. SPOTIFY_DESCRIPTION: A description for Spotify (max {spotify_max_length} characters) that includes:
+   - A concise summary of the episode
+   - Key takeaways
+   - Keep it more conversational than YouTube
+
+5. TAGS: {max_tags} relevant tags/keywords for discoverability (comma-separated)
+
+Format your response exactly as follows:
+YOUTUBE_TITLE: [title here]
+YOUTUBE_DESCRIPTION: [description here]
+SPOTIFY_TITLE: [title here]
+SPOTIFY_DESCRIPTION: [description here]
+TAGS: [tag1, tag2, tag3, ...]
+"""
+
+
+def _truncate_transcript(transcript: str, limit: int = _TRANSCRIPT_PREFIX_LIMIT) -> str:
+    """
+    Clip a transcript to the prompt budget at a natural boundary.
+
+    Prefers the last paragraph break within the limit, then the last
+    sentence end, so the model isn't handed a mid-sentence fragment.
+    """
+    if len(transcript) <= limit:
+        return transcript
+
+    cut = transcript.rfind("\n\n", 0, limit)
+    if cut == -1:
+        cut = transcript.rfind(". ", 0, limit)
+        if cut != -1:
+            cut += 1  # Keep the closing period
+    if cut <= 0:
+        cut = limit
+    return transcript[:cut]
 
 
 def generate_descriptions(
@@ -78,43 +175,21 @@ def generate_descriptions(
     # Configure API
     configure_gemini(api_key)
 
-    # Build the prompt
-    prompt = f"""You are a podcast content assistant. Based on the following transcript, generate content for publishing this episode.
-
-Episode Title: {episode_title}
-
-Transcript:
-{transcript[:10000]}  # Limit transcript length for API
-
-Please generate:
-
-1. YOUTUBE_TITLE: A catchy, SEO-friendly title for YouTube (max 100 characters). Keep it engaging but informative.
-
-2. YOUTUBE_DESCRIPTION: A comprehensive description for YouTube (max {youtube_max_length} characters) that includes:
-   - A brief summary of the episode (2-3 sentences)
-   - Key topics discussed (bullet points)
-   - Timestamps for major sections if identifiable
-   - A call to action to subscribe
-
-3. SPOTIFY_TITLE: The episode title for Spotify (can be same as original or slightly modified, max 100 characters)
-
-4. SPOTIFY_DESCRIPTION: A description for Spotify (max {spotify_max_length} characters) that includes:
-   - A concise summary of the episode
-   - Key takeaways
-   - Keep it more conversational than YouTube
-
-5. TAGS: {max_tags} relevant tags/keywords for discoverability (comma-separated)
+    # Build the prompt from the precomputed template, truncating the
+    # transcript at a sentence boundary so no tokens are wasted on a
+    # mid-sentence fragment.
+    prompt = _PROMPT_TMPL.format(
+        episode_title=episode_title,
+        transcript=_truncate_transcript(transcript),
+        youtube_max_length=youtube_max_length,
+        spotify_max_length=spotify_max_length,
+        max_tags=max_tags,
+    )
 
-Format your response exactly as follows:
-YOUTUBE_TITLE: [title here]
-YOUTUBE_DESCRIPTION: [description here]
-SPOTIFY_TITLE: [title here]
-SPOTIFY_DESCRIPTION: [description here]
-TAGS: [tag1, tag2, tag3, ...]
-"""
+    genai = _require_genai()
 
     try:
-        model = genai.GenerativeModel(model_name)
+        model = _get_model(model_name)
 
         response = model.generate_content(
             prompt,
@@ -143,6 +218,24 @@ TAGS: [tag1, tag2, tag3, ...]
         raise SummaryError(f"Summary generation failed: {e}")
 
 
+# Field headers recognized in Gemini responses, found in one multiline
+# scan over the whole response instead of per-line prefix comparisons.
+# Only horizontal whitespace may appear around the colon - \s would
+# match newlines, letting an empty-valued header swallow the next
+# field's header line.
+_FIELD_RE = re.compile(
+    r"^[ \t]*(YOUTUBE_TITLE|YOUTUBE_DESCRIPTION|SPOTIFY_TITLE|SPOTIFY_DESCRIPTION|TAGS)[ \t]*:[ \t]*(.*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_FIELD_MAP = {
+    "YOUTUBE_TITLE": "youtube_title",
+    "YOUTUBE_DESCRIPTION": "youtube_description",
+    "SPOTIFY_TITLE": "spotify_title",
+    "SPOTIFY_DESCRIPTION": "spotify_description",
+    "TAGS": "tags",
+}
+
+
 def _parse_response(
     response_text: str,
     fallback_title: str,
@@ -167,51 +260,23 @@ def _parse_response(
         "tags": [],
     }
 
-    lines = response_text.strip().split("\n")
-    current_field = None
-    current_content = []
-
-    field_mapping = {
-        "YOUTUBE_TITLE:": "youtube_title",
-        "YOUTUBE_DESCRIPTION:": "youtube_description",
-        "SPOTIFY_TITLE:": "spotify_title",
-        "SPOTIFY_DESCRIPTION:": "spotify_description",
-        "TAGS:": "tags",
-    }
-
-    for line in lines:
-        line_upper = line.strip().upper()
-
-        # Check if this line starts a new field
-        found_field = None
-        for prefix, field_name in field_mapping.items():
-            if line_upper.startswith(prefix.upper()):
-                found_field = field_name
-                # Get content after the prefix
-                content = line[len(prefix):].strip()
-                break
-
-        if found_field:
-            # Save previous field content
-            if current_field and current_content:
-                if current_field == "tags":
-                    result[current_field] = _parse_tags("\n".join(current_content))
-                else:
-                    result[current_field] = "\n".join(current_content).strip()
-
-            # Start new field
-            current_field = found_field
-            current_content = [content] if content else []
-        elif current_field:
-            # Continue current field
-            current_content.append(line)
-
-    # Save last field
-    if current_field and current_content:
-        if current_field == "tags":
-            result[current_field] = _parse_tags("\n".join(current_content))
+    # One multiline scan finds every field header; each field's content is
+    # the header remainder plus the slice up to the next header, so there
+    # is no per-line Python loop at all.
+    matches = list(_FIELD_RE.finditer(response_text))
+    for position, match in enumerate(matches):
+        field = _FIELD_MAP[match.group(1).upper()]
+        if position + 1 < len(matches):
+            end = matches[position + 1].start()
+        else:
+            end = len(response_text)
+        content = (match.group(2) + response_text[match.end():end]).strip()
+        if not content:
+            continue  # Keep the fallback value
+        if field == "tags":
+            result[field] = _parse_tags(content)
         else:
-            result[current_field] = "\n".join(current_content).strip()
+            result[field] = content
 
     # Clean up tags if not requested
     if not include_tags:
@@ -220,6 +285,10 @@ def _parse_response(
     return result
 
 
+# Splits a tag list on runs of comma/newline separators
+_SPLIT_TAGS = re.compile(r"[,\n]+")
+
+
 def _parse_tags(tags_text: str) -> List[str]:
     """
     Parse tags from text.
@@ -230,7 +299,6 @@ def _parse_tags(tags_text: str) -> List[str]:
     Returns:
         List of cleaned tags
     """
-    # Handle both comma and newline separated
-    tags_text = tags_text.replace("\n", ",")
-    tags = [tag.strip().strip("#") for tag in tags_text.split(",")]
+    # One split pass and a lazy per-tag cleanup; empty segments drop out
+    tags = (tag.strip().strip("#") for tag in _SPLIT_TAGS.split(tags_text))
     return [tag for tag in tags if tag]  # Remove empty tags
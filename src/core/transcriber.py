@@ -1,13 +1,46 @@
 """Transcribe audio using Gemini API."""
 
+import atexit
+import functools
+import hashlib
+import io
+import json
+import math
 import os
+import random
+import shutil
+import struct
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List
 
-import google.generativeai as genai
+# google.generativeai drags in gRPC/protobuf and several MB of generated
+# stubs - hundreds of ms on every import. It's loaded on first API use
+# instead of at module import, so commands that never transcribe (and the
+# CLI's own startup) don't pay for it. Tests replace this attribute with
+# a double.
+genai = None
+
+
+def _require_genai():
+    """Import google.generativeai on first use and return it."""
+    global genai
+    if genai is None:
+        import google.generativeai
+
+        genai = google.generativeai
+    return genai
+
+
+# Resolve the binaries once at import: every subprocess spawn then skips
+# the per-exec PATH walk, and a missing install is visible immediately in
+# error messages rather than buried in exec failures.
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
 
 
 class TranscriptionError(Exception):
@@ -16,10 +49,25 @@ class TranscriptionError(Exception):
     pass
 
 
+# In chunked mode every chunk re-entered configure and rebuilt the model,
+# re-initializing the SDK transport each time. Both are cached; the live
+# genai module object is part of the key so test doubles get fresh state.
+_configured = [None]
+_MODEL_CACHE: dict = {}
+
+# Ask gRPC to gzip request payloads (transcript responses are negotiated
+# through the standard grpc-accept-encoding header the channel already
+# sends). CJK transcript chunks compress several-fold.
+_GRPC_COMPRESSION_METADATA = (("grpc-internal-encoding-request", "gzip"),)
+
+
 def configure_gemini(api_key: Optional[str] = None) -> None:
     """
     Configure the Gemini API with the provided key.
 
+    genai.configure is only invoked when the key (or the genai module
+    itself) changed since the last call.
+
     Args:
         api_key: Gemini API key. If None, reads from GEMINI_API_KEY env var.
 
@@ -34,7 +82,257 @@ def configure_gemini(api_key: Optional[str] = None) -> None:
             "Set GEMINI_API_KEY environment variable or pass api_key parameter."
         )
 
-    genai.configure(api_key=key)
+    genai = _require_genai()
+    if _configured[0] != (genai, key):
+        try:
+            genai.configure(api_key=key, default_metadata=_GRPC_COMPRESSION_METADATA)
+        except TypeError:
+            # Older SDKs don't accept default_metadata
+            genai.configure(api_key=key)
+        _configured[0] = (genai, key)
+
+
+def _get_model(model_name: str):
+    """Return a cached GenerativeModel for model_name."""
+    genai = _require_genai()
+    cache_key = (genai, model_name)
+    model = _MODEL_CACHE.get(cache_key)
+    if model is None:
+        model = genai.GenerativeModel(model_name)
+        _MODEL_CACHE[cache_key] = model
+    return model
+
+
+# Transcript cache: keyed on audio content + request parameters, so
+# re-running a pipeline on the same episode skips the upload and the bill.
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "clubhouse-podcast" / "transcripts"
+_CACHE_MAX_BYTES = 1 << 30  # 1 GiB
+
+
+def _cache_key(
+    audio_path: Path,
+    model_name: str,
+    prompt: str,
+    compress_for_asr: bool,
+) -> str:
+    """Return a cache key from the audio bytes and request parameters.
+
+    The effective prompt covers language and timestamp mode (and any
+    caller-supplied override), and the compression flag changes the
+    audio actually uploaded, so both belong in the key.
+    """
+    digest = hashlib.sha256()
+    with open(audio_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    params = json.dumps(
+        {
+            "model": model_name,
+            "prompt": prompt,
+            "compress": compress_for_asr,
+        },
+        sort_keys=True,
+    )
+    digest.update(params.encode())
+    return digest.hexdigest()
+
+
+def _evict_cache(cache_dir: Path, max_bytes: int = _CACHE_MAX_BYTES) -> None:
+    """Delete oldest cache entries until the directory fits max_bytes."""
+    try:
+        entries = [
+            (p.stat().st_mtime, p.stat().st_size, p)
+            for p in cache_dir.glob("*.txt")
+        ]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries):
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+# Upload deletions are an RTT whose result we ignore; they run on this
+# small background pool instead of the chunk critical path. atexit makes
+# sure pending deletes finish before the process exits.
+_cleanup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upload-cleanup")
+atexit.register(_cleanup_pool.shutdown, wait=True)
+
+
+def _delete_quietly(audio_file) -> None:
+    try:
+        audio_file.delete()
+    except Exception:
+        pass  # Uploads auto-expire server-side anyway
+
+
+# Retry policy for transient API failures (rate limits, brief outages)
+_MAX_ATTEMPTS = 5
+_BACKOFF_MAX_SECONDS = 60
+
+
+def _is_transient_api_error(exc: Exception) -> bool:
+    """Whether an API failure is worth retrying with backoff."""
+    msg = str(exc).lower()
+    return any(
+        marker in msg
+        for marker in (
+            "429",
+            "quota",
+            "resource_exhausted",
+            "resource exhausted",
+            "rate limit",
+            "503",
+            "unavailable",
+            "deadline",
+        )
+    )
+
+
+# Language codes mapped to the descriptions used in transcription prompts
+_LANGUAGE_MAP = {
+    # Chinese variants
+    "yue": "Cantonese (Hong Kong)",
+    "zh-HK": "Cantonese (Hong Kong)",
+    "zh": "Mandarin Chinese",
+    "zh-CN": "Mandarin Chinese (Simplified)",
+    "zh-TW": "Traditional Chinese (Taiwan)",
+    # East Asian
+    "ja": "Japanese",
+    "ko": "Korean",
+    # Southeast Asian
+    "vi": "Vietnamese",
+    "th": "Thai",
+    "id": "Indonesian",
+    "ms": "Malay",
+    "tl": "Tagalog (Filipino)",
+    # European
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "nl": "Dutch",
+    "ru": "Russian",
+    # South Asian
+    "hi": "Hindi",
+    "ta": "Tamil",
+    # Middle Eastern
+    "ar": "Arabic",
+    "he": "Hebrew",
+}
+
+_PROMPT_WITH_TS_TMPL = """Transcribe the following audio file accurately.
+
+Background: This is an audio recording from an online live show or podcast conversation with multiple speakers.
+
+Language: {lang_desc}
+
+Instructions:
+- Transcribe all spoken content into clear, complete sentences
+- Include timestamps in the format [MM:SS] at the beginning of each paragraph or when the speaker changes
+- Preserve the natural flow of conversation
+- Keep colloquial expressions and slang as spoken
+- Separate different speakers' dialogue into distinct paragraphs
+- Provide only the transcript, no additional commentary or summaries"""
+
+_PROMPT_NO_TS_TMPL = """Transcribe the following audio file accurately.
+
+Background: This is an audio recording from an online live show or podcast conversation with multiple speakers.
+
+Language: {lang_desc}
+
+Instructions:
+- Transcribe all spoken content into clear, complete sentences
+- Preserve the natural flow of conversation
+- Keep colloquial expressions and slang as spoken
+- Separate different speakers' dialogue into distinct paragraphs
+- Provide only the transcript text, no timestamps or additional commentary"""
+
+
+def _build_prompt(language: str, include_timestamps: bool) -> str:
+    """Build a transcription prompt for a language code."""
+    language_desc = _LANGUAGE_MAP.get(language)
+    if language_desc is None:
+        print(f"Note: Language code '{language}' not in mapping, using as-is")
+        language_desc = language
+    else:
+        # Keep the raw code alongside the description ("Mandarin Chinese
+        # (zh)") so the model sees both forms.
+        language_desc = f"{language_desc} ({language})"
+
+    template = _PROMPT_WITH_TS_TMPL if include_timestamps else _PROMPT_NO_TS_TMPL
+    return template.format(lang_desc=language_desc)
+
+
+# Audio below this size is sent inline with the generate call (one RTT)
+# instead of the separate resumable upload plus delete (three)
+_INLINE_MAX_BYTES = 20 * 1024 * 1024
+
+_MIME_BY_SUFFIX = {
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".aac": "audio/aac",
+    ".ogg": "audio/ogg",
+    ".opus": "audio/ogg",
+    ".wav": "audio/wav",
+    ".flac": "audio/flac",
+}
+
+
+# Files below this size aren't worth an ffmpeg pass before upload
+_COMPRESS_MIN_BYTES = 1 << 20
+
+
+def _compress_for_asr(audio_path: Path, ffmpeg_path: str = _FFMPEG) -> Optional[Path]:
+    """
+    Silence-strip and downsample audio into a small mono Opus file.
+
+    Speech recognition doesn't benefit from stereo 44.1 kHz input, and
+    Gemini bills by audio seconds - removing silence and re-encoding at
+    16 kHz/24 kbps cuts both upload bytes and billable duration.
+
+    Returns:
+        Path to a temporary .ogg file (caller deletes it), or None if
+        compression failed - callers then upload the original audio.
+    """
+    tmp = tempfile.NamedTemporaryFile(suffix=".ogg", delete=False)
+    tmp.close()
+
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg_path,
+                "-y",
+                "-i", str(audio_path),
+                "-ac", "1",
+                "-ar", "16000",
+                "-af", "silenceremove=stop_periods=-1:stop_duration=0.6:stop_threshold=-40dB",
+                "-c:a", "libopus",
+                "-b:a", "24k",
+                tmp.name,
+            ],
+            capture_output=True,
+            timeout=3600,
+        )
+        if result.returncode == 0 and os.path.getsize(tmp.name) > 0:
+            return Path(tmp.name)
+    except (subprocess.SubprocessError, OSError):
+        pass
+
+    try:
+        os.unlink(tmp.name)
+    except OSError:
+        pass
+    return None
 
 
 def transcribe_audio(
@@ -43,16 +341,43 @@ def transcribe_audio(
     language: str = "en",
     include_timestamps: bool = False,
     model_name: str = "gemini-2.5-flash",
+    cache_dir: Optional[Path] = None,
+    no_cache: bool = False,
+    compress_for_asr: bool = True,
+    prompt: Optional[str] = None,
+    delete_uploads: bool = True,
+    inline_max_bytes: int = _INLINE_MAX_BYTES,
+    stream_response: bool = False,
 ) -> str:
     """
     Transcribe audio using Gemini API.
 
+    Results are cached on disk keyed by a hash of the audio content and
+    the request parameters, so re-transcribing an unchanged file (common
+    while iterating on summarization prompts) is a local read instead of
+    an upload plus billable inference.
+
     Args:
         audio_path: Path to audio file (MP3, WAV, etc.)
         api_key: Gemini API key. If None, reads from GEMINI_API_KEY env var.
         language: Language code (ISO 639-1) for transcription
         include_timestamps: Whether to include timestamps in transcript
         model_name: Gemini model to use
+        cache_dir: Transcript cache directory
+                   (default: ~/.cache/clubhouse-podcast/transcripts)
+        no_cache: Skip the cache entirely
+        compress_for_asr: Silence-strip and downsample the audio before
+                          upload (skipped in timestamp mode, where removing
+                          silence would shift the timeline, and for files
+                          under 1 MiB)
+        prompt: Pre-built prompt; the chunked path passes one in so it
+                isn't rebuilt per chunk
+        delete_uploads: Delete the uploaded file afterwards (done on a
+                        background thread, off the critical path)
+        inline_max_bytes: Audio up to this size is sent inline with the
+                          generate call instead of via a separate upload
+        stream_response: Stream the transcript and print tokens as they
+                         arrive instead of waiting for the full decode
 
     Returns:
         Full transcript text
@@ -70,101 +395,129 @@ def transcribe_audio(
     if not audio_path.is_file():
         raise FileNotFoundError(f"Path is not a file: {audio_path}")
 
-    # Configure API
-    configure_gemini(api_key)
-
-    # Map language codes to human-readable descriptions
-    language_map = {
-        # Chinese variants
-        "yue": "Cantonese (Hong Kong)",
-        "zh-HK": "Cantonese (Hong Kong)",
-        "zh": "Mandarin Chinese",
-        "zh-CN": "Mandarin Chinese (Simplified)",
-        "zh-TW": "Traditional Chinese (Taiwan)",
-        # East Asian
-        "ja": "Japanese",
-        "ko": "Korean",
-        # Southeast Asian
-        "vi": "Vietnamese",
-        "th": "Thai",
-        "id": "Indonesian",
-        "ms": "Malay",
-        "tl": "Tagalog (Filipino)",
-        # European
-        "en": "English",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "nl": "Dutch",
-        "ru": "Russian",
-        # South Asian
-        "hi": "Hindi",
-        "ta": "Tamil",
-        # Middle Eastern
-        "ar": "Arabic",
-        "he": "Hebrew",
-    }
-    language_desc = language_map.get(language)
-    if language_desc is None:
-        print(f"Note: Language code '{language}' not in mapping, using as-is")
-        language_desc = language
-
-    # Build the prompt
-    if include_timestamps:
-        prompt = f"""Transcribe the following audio file accurately.
-
-Background: This is an audio recording from an online live show or podcast conversation with multiple speakers.
-
-Language: {language_desc}
+    # Build the prompt first (the chunked path prebuilds one and passes
+    # it in); it participates in the cache key below.
+    if prompt is None:
+        prompt = _build_prompt(language, include_timestamps)
 
-Instructions:
-- Transcribe all spoken content into clear, complete sentences
-- Include timestamps in the format [MM:SS] at the beginning of each paragraph or when the speaker changes
-- Preserve the natural flow of conversation
-- Keep colloquial expressions and slang as spoken
-- Separate different speakers' dialogue into distinct paragraphs
-- Provide only the transcript, no additional commentary or summaries"""
-    else:
-        prompt = f"""Transcribe the following audio file accurately.
-
-Background: This is an audio recording from an online live show or podcast conversation with multiple speakers.
-
-Language: {language_desc}
+    # Cache lookup before any network work
+    cache_path = None
+    if not no_cache:
+        cache_dir = Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR
+        try:
+            key = _cache_key(audio_path, model_name, prompt, compress_for_asr)
+            cache_path = cache_dir / f"{key}.txt"
+            if cache_path.exists():
+                return cache_path.read_text()
+        except OSError:
+            cache_path = None  # Unreadable cache; transcribe as usual
 
-Instructions:
-- Transcribe all spoken content into clear, complete sentences
-- Preserve the natural flow of conversation
-- Keep colloquial expressions and slang as spoken
-- Separate different speakers' dialogue into distinct paragraphs
-- Provide only the transcript text, no timestamps or additional commentary"""
+    # Configure API
+    configure_gemini(api_key)
+    genai = _require_genai()
+
+    # Shrink the upload when worthwhile. Timestamp mode keeps the original
+    # audio so the [MM:SS] markers match the source timeline.
+    upload_path = audio_path
+    compressed_path = None
+    if (
+        compress_for_asr
+        and not include_timestamps
+        and audio_path.stat().st_size >= _COMPRESS_MIN_BYTES
+    ):
+        compressed_path = _compress_for_asr(audio_path)
+        if compressed_path is not None:
+            upload_path = compressed_path
 
     try:
-        # Upload the audio file
-        audio_file = genai.upload_file(str(audio_path))
-
-        # Create the model and generate transcription
-        model = genai.GenerativeModel(model_name)
-
-        response = model.generate_content(
-            [prompt, audio_file],
-            generation_config=genai.GenerationConfig(
-                temperature=0.1,  # Low temperature for accuracy
-                max_output_tokens=8192,
-            ),
-        )
-
-        # Clean up uploaded file
-        try:
-            audio_file.delete()
-        except Exception:
-            pass  # Ignore cleanup errors
+        # Create (or reuse) the model
+        model = _get_model(model_name)
+
+        # Small audio is passed inline with the generate call; a chunked
+        # episode's chunks usually fit, cutting per-chunk RTTs from three
+        # (upload init + bytes + delete) to one.
+        inline_part = None
+        mime_type = _MIME_BY_SUFFIX.get(upload_path.suffix.lower())
+        if mime_type and upload_path.stat().st_size < inline_max_bytes:
+            inline_part = {"mime_type": mime_type, "data": upload_path.read_bytes()}
+
+        # Upload (or inline) and transcribe, retrying transient rate-limit
+        # or availability failures with exponential backoff plus jitter.
+        audio_file = None
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                if inline_part is not None:
+                    media = inline_part
+                else:
+                    audio_file = genai.upload_file(str(upload_path))
+                    media = audio_file
+
+                generation_config = genai.GenerationConfig(
+                    temperature=0.1,  # Low temperature for accuracy
+                    max_output_tokens=8192,
+                )
 
-        if not response.text:
-            raise TranscriptionError("Gemini returned empty response")
+                if stream_response:
+                    # Print tokens as the server produces them; for a
+                    # multi-minute decode the user sees progress instead
+                    # of a silent wait.
+                    parts = []
+                    for part in model.generate_content(
+                        [prompt, media],
+                        generation_config=generation_config,
+                        stream=True,
+                    ):
+                        text = getattr(part, "text", "") or ""
+                        parts.append(text)
+                        print(text, end="", flush=True)
+                    print(flush=True)
+                    streamed_text = "".join(parts)
+                else:
+                    response = model.generate_content(
+                        [prompt, media],
+                        generation_config=generation_config,
+                    )
+                break
+            except Exception as e:
+                # Don't leave an orphaned upload behind before re-uploading
+                if audio_file is not None:
+                    try:
+                        audio_file.delete()
+                    except Exception:
+                        pass
+                    audio_file = None
+                if attempt == _MAX_ATTEMPTS - 1 or not _is_transient_api_error(e):
+                    raise
+                backoff = min(_BACKOFF_MAX_SECONDS, 2 ** attempt) + random.uniform(0, 1)
+                time.sleep(backoff)
+
+        # Clean up the uploaded file off the critical path; in chunked
+        # mode the old synchronous delete cost one RTT per chunk. Inline
+        # requests never created a file to delete.
+        if delete_uploads and audio_file is not None:
+            _cleanup_pool.submit(_delete_quietly, audio_file)
+
+        if stream_response:
+            if not streamed_text:
+                raise TranscriptionError("Gemini returned empty response")
+            transcript = streamed_text.strip()
+        else:
+            if not response.text:
+                raise TranscriptionError("Gemini returned empty response")
+            transcript = response.text.strip()
+
+        # Store in the cache (atomically; best-effort)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(transcript)
+                os.replace(tmp_path, cache_path)
+                _evict_cache(cache_path.parent)
+            except OSError:
+                pass
 
-        return response.text.strip()
+        return transcript
 
     except TranscriptionError:
         # Re-raise our own errors
@@ -176,12 +529,182 @@ Instructions:
         elif "blocked" in error_msg or "safety" in error_msg:
             raise TranscriptionError(f"Content blocked by Gemini safety filters: {e}")
         raise TranscriptionError(f"Transcription failed: {e}")
+    finally:
+        if compressed_path is not None:
+            try:
+                os.unlink(compressed_path)
+            except OSError:
+                pass
+
+
+def _read_atom_header(f) -> Optional[tuple]:
+    """Read one ISO-BMFF atom header; returns (size, name, header_size) or None."""
+    header = f.read(8)
+    if len(header) < 8:
+        return None
+    size, name = struct.unpack(">I4s", header)
+    header_size = 8
+    if size == 1:  # 64-bit extended size
+        ext = f.read(8)
+        if len(ext) < 8:
+            return None
+        size = struct.unpack(">Q", ext)[0]
+        header_size = 16
+    return size, name, header_size
+
+
+def _duration_from_mp4(audio_path: Path) -> Optional[float]:
+    """
+    Read the duration of an MP4/M4A file from its mvhd atom.
+
+    Walks the top-level atoms for moov, then moov's children for mvhd,
+    and returns duration/timescale (ISO/IEC 14496-12). Returns None when
+    the structure can't be parsed.
+    """
+    try:
+        file_size = audio_path.stat().st_size
+        with open(audio_path, "rb") as f:
+            # Find the top-level moov atom
+            offset = 0
+            moov_end = None
+            while offset < file_size:
+                f.seek(offset)
+                atom = _read_atom_header(f)
+                if atom is None:
+                    return None
+                size, name, header_size = atom
+                if size == 0:  # Atom extends to end of file
+                    size = file_size - offset
+                if size < header_size:
+                    return None
+                if name == b"moov":
+                    moov_end = offset + size
+                    offset += header_size
+                    break
+                offset += size
+
+            if moov_end is None:
+                return None
+
+            # Find mvhd among moov's children
+            while offset < moov_end:
+                f.seek(offset)
+                atom = _read_atom_header(f)
+                if atom is None:
+                    return None
+                size, name, header_size = atom
+                if size == 0:
+                    size = moov_end - offset
+                if size < header_size:
+                    return None
+                if name == b"mvhd":
+                    body = f.read(32)
+                    if len(body) < 32:
+                        return None
+                    if body[0] == 1:  # Version 1: 64-bit times
+                        timescale, duration = struct.unpack(">IQ", body[20:32])
+                    else:  # Version 0: 32-bit times
+                        timescale, duration = struct.unpack(">II", body[12:20])
+                    if timescale:
+                        return duration / timescale
+                    return None
+                offset += size
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+def _duration_from_mp3(audio_path: Path) -> Optional[float]:
+    """
+    Read the duration of an MP3 from its Xing/Info VBR header.
+
+    Skips an ID3v2 tag if present, parses the first MPEG audio frame
+    header, and computes total_frames * samples_per_frame / sample_rate.
+    Returns None for CBR files without a Xing/Info tag or on parse
+    failure (the ffprobe fallback handles those).
+    """
+    try:
+        with open(audio_path, "rb") as f:
+            head = f.read(10)
+            if len(head) < 10:
+                return None
+
+            # Skip ID3v2 tag (syncsafe 28-bit size)
+            offset = 0
+            if head[:3] == b"ID3":
+                offset = 10 + (
+                    ((head[6] & 0x7F) << 21)
+                    | ((head[7] & 0x7F) << 14)
+                    | ((head[8] & 0x7F) << 7)
+                    | (head[9] & 0x7F)
+                )
+
+            f.seek(offset)
+            frame = f.read(4)
+            if len(frame) < 4 or frame[0] != 0xFF or (frame[1] & 0xE0) != 0xE0:
+                return None
+
+            version_bits = (frame[1] >> 3) & 0x03  # 3=MPEG1, 2=MPEG2, 0=MPEG2.5
+            layer_bits = (frame[1] >> 1) & 0x03  # 1=Layer III
+            sr_bits = (frame[2] >> 2) & 0x03
+            if layer_bits != 1 or sr_bits == 3:
+                return None
+
+            sample_rates = {
+                3: (44100, 48000, 32000),
+                2: (22050, 24000, 16000),
+                0: (11025, 12000, 8000),
+            }.get(version_bits)
+            if sample_rates is None:
+                return None
+            sample_rate = sample_rates[sr_bits]
+            samples_per_frame = 1152 if version_bits == 3 else 576
+
+            # Xing/Info sits after the side info block
+            channel_mode = (frame[3] >> 6) & 0x03
+            if version_bits == 3:
+                side_info = 17 if channel_mode == 3 else 32
+            else:
+                side_info = 9 if channel_mode == 3 else 17
+
+            f.seek(offset + 4 + side_info)
+            tag = f.read(8)
+            if len(tag) < 8 or tag[:4] not in (b"Xing", b"Info"):
+                return None
+            flags = struct.unpack(">I", tag[4:8])[0]
+            if not flags & 0x01:  # Frame count not present
+                return None
+            frames = struct.unpack(">I", f.read(4))[0]
+            return frames * samples_per_frame / sample_rate
+    except (OSError, struct.error):
+        return None
+
+
+def _duration_via_mutagen(audio_path: Path) -> Optional[float]:
+    """Read duration in-process via mutagen, when it happens to be installed."""
+    try:
+        from mutagen import File as MutagenFile
+    except ImportError:
+        return None
+
+    try:
+        parsed = MutagenFile(str(audio_path))
+        if parsed is not None and getattr(parsed.info, "length", 0) > 0:
+            return float(parsed.info.length)
+    except Exception:
+        pass
+    return None
 
 
-def get_audio_duration(audio_path: Path, ffprobe_path: str = "ffprobe") -> float:
+def get_audio_duration(audio_path: Path, ffprobe_path: str = _FFPROBE) -> float:
     """
     Get the duration of an audio file in seconds.
 
+    MP4/M4A and MP3 durations are read straight from the container
+    headers (a sub-millisecond file read); other formats go through
+    mutagen when it's installed. ffprobe is only spawned as the last
+    resort. Results are memoized per (path, mtime).
+
     Args:
         audio_path: Path to audio file
         ffprobe_path: Path to ffprobe executable
@@ -192,6 +715,30 @@ def get_audio_duration(audio_path: Path, ffprobe_path: str = "ffprobe") -> float
     Raises:
         TranscriptionError: If duration cannot be determined
     """
+    audio_path = Path(audio_path)
+    try:
+        st = audio_path.stat()
+    except OSError as e:
+        raise TranscriptionError(f"Failed to get audio duration: {e}")
+    return _cached_duration(str(audio_path), st.st_mtime_ns, ffprobe_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_duration(path_str: str, mtime_ns: int, ffprobe_path: str) -> float:
+    """Duration lookup behind get_audio_duration, memoized per (path, mtime)."""
+    audio_path = Path(path_str)
+    suffix = audio_path.suffix.lower()
+
+    duration = None
+    if suffix in (".mp4", ".m4a", ".mov"):
+        duration = _duration_from_mp4(audio_path)
+    elif suffix == ".mp3":
+        duration = _duration_from_mp3(audio_path)
+    if duration is None:
+        duration = _duration_via_mutagen(audio_path)
+    if duration is not None:
+        return duration
+
     try:
         result = subprocess.run(
             [
@@ -214,7 +761,7 @@ def split_audio(
     audio_path: Path,
     output_dir: Path,
     chunk_duration_seconds: int,
-    ffmpeg_path: str = "ffmpeg",
+    ffmpeg_path: str = _FFMPEG,
 ) -> List[Path]:
     """
     Split an audio file into chunks of specified duration.
@@ -232,57 +779,413 @@ def split_audio(
         TranscriptionError: If splitting fails
     """
     output_dir.mkdir(parents=True, exist_ok=True)
+    audio_path = Path(audio_path)
 
-    # Get total duration
-    total_duration = get_audio_duration(audio_path)
+    # Raw input (WAV/PCM) must be re-encoded chunk by chunk; those encodes
+    # are CPU-bound and independent, so they run in parallel. Compressed
+    # input keeps the single demux-only segment pass.
+    if audio_path.suffix.lower() not in _COPY_SEGMENT_SUFFIXES:
+        return _split_audio_parallel_encode(
+            audio_path, output_dir, chunk_duration_seconds, ffmpeg_path
+        )
 
-    chunks = []
-    chunk_num = 0
-    start_time = 0
+    # A single segment-muxer invocation writes every chunk in one pass,
+    # instead of N runs that each re-read and re-decode up to their seek
+    # point (O(N^2) decode work). On the happy path stderr goes straight
+    # to /dev/null; only a failure pays for a diagnostic re-run.
+    cmd = _segment_command(audio_path, output_dir, chunk_duration_seconds, ffmpeg_path)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if result.returncode != 0:
+        # Re-run for a diagnostic; if the retry happens to succeed
+        # (transient failure), just use its output.
+        diag = subprocess.run(cmd, capture_output=True)
+        if diag.returncode != 0:
+            raise TranscriptionError(
+                f"Failed to split audio: {diag.stderr.decode(errors='replace')}"
+            )
 
-    while start_time < total_duration:
-        chunk_path = output_dir / f"chunk_{chunk_num:03d}.mp3"
+    chunks = sorted(output_dir.glob(f"chunk_*{_segment_suffix(audio_path)}"))
+    if not chunks:
+        raise TranscriptionError(f"Splitting produced no chunks for {audio_path}")
+    return chunks
 
-        try:
-            subprocess.run(
-                [
-                    ffmpeg_path,
-                    "-y",  # Overwrite
-                    "-i", str(audio_path),
-                    "-ss", str(start_time),
-                    "-t", str(chunk_duration_seconds),
-                    "-acodec", "libmp3lame",
-                    "-q:a", "2",
-                    str(chunk_path),
-                ],
-                capture_output=True,
-                check=True,
-            )
-            chunks.append(chunk_path)
-        except subprocess.CalledProcessError as e:
-            raise TranscriptionError(f"Failed to split audio at {start_time}s: {e.stderr.decode()}")
 
-        start_time += chunk_duration_seconds
-        chunk_num += 1
+def _encode_chunk(
+    audio_path: Path,
+    chunk_path: Path,
+    start_seconds: float,
+    chunk_duration_seconds: int,
+    ffmpeg_path: str,
+) -> Path:
+    """Encode one MP3 chunk from a raw audio file (seek is O(1) in PCM)."""
+    result = subprocess.run(
+        [
+            ffmpeg_path,
+            "-nostats",
+            "-loglevel", "error",
+            "-y",
+            "-ss", str(start_seconds),
+            "-t", str(chunk_duration_seconds),
+            "-i", str(audio_path),
+            "-acodec", "libmp3lame",
+            "-q:a", "2",
+            str(chunk_path),
+        ],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise TranscriptionError(
+            f"Failed to encode chunk at {start_seconds}s: "
+            f"{result.stderr.decode(errors='replace')}"
+        )
+    return chunk_path
 
+
+def _split_audio_parallel_encode(
+    audio_path: Path,
+    output_dir: Path,
+    chunk_duration_seconds: int,
+    ffmpeg_path: str,
+) -> List[Path]:
+    """Re-encode a raw audio file into MP3 chunks across CPU cores."""
+    total_duration = get_audio_duration(
+        audio_path, ffmpeg_path.replace("ffmpeg", "ffprobe")
+    )
+
+    starts = []
+    start = 0.0
+    while start < total_duration:
+        starts.append(start)
+        start += chunk_duration_seconds
+
+    workers = max(1, (os.cpu_count() or 2) // 2)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _encode_chunk,
+                audio_path,
+                output_dir / f"chunk_{i:03d}.mp3",
+                chunk_start,
+                chunk_duration_seconds,
+                ffmpeg_path,
+            )
+            for i, chunk_start in enumerate(starts)
+        ]
+        chunks = [future.result() for future in futures]
+
+    if not chunks:
+        raise TranscriptionError(f"Splitting produced no chunks for {audio_path}")
     return chunks
 
 
+# Compressed formats whose packets can be routed into same-container
+# segments without a decode/encode cycle
+_COPY_SEGMENT_SUFFIXES = frozenset({".mp3", ".m4a", ".aac", ".opus", ".ogg"})
+
+
+def _segment_suffix(audio_path: Path) -> str:
+    """Return the chunk file extension used when segmenting audio_path."""
+    suffix = audio_path.suffix.lower()
+    return suffix if suffix in _COPY_SEGMENT_SUFFIXES else ".mp3"
+
+
+def _segment_command(
+    audio_path: Path,
+    output_dir: Path,
+    chunk_duration_seconds: int,
+    ffmpeg_path: str,
+    segment_times: Optional[List[float]] = None,
+) -> List[str]:
+    """Build the ffmpeg segment-muxer command used to chunk an audio file."""
+    # Already-compressed input is split at packet level into the same
+    # container (bit-exact, demux-only); raw formats like WAV are
+    # re-encoded into MP3 chunks as before.
+    suffix = _segment_suffix(audio_path)
+    if audio_path.suffix.lower() in _COPY_SEGMENT_SUFFIXES:
+        codec_args = ["-c", "copy"]
+    else:
+        codec_args = ["-acodec", "libmp3lame", "-q:a", "2"]
+
+    if segment_times:
+        timing_args = ["-segment_times", ",".join(f"{t:.3f}" for t in segment_times)]
+    else:
+        timing_args = ["-segment_time", str(chunk_duration_seconds)]
+
+    return [
+        ffmpeg_path,
+        "-nostats",  # No progress chatter; only errors reach stderr
+        "-loglevel", "error",
+        "-y",  # Overwrite
+        "-i", str(audio_path),
+        "-f", "segment",
+        *timing_args,
+        "-reset_timestamps", "1",
+        *codec_args,
+        str(output_dir / f"chunk_%03d{suffix}"),
+    ]
+
+
+def _detect_silences(
+    audio_path: Path,
+    ffmpeg_path: str = _FFMPEG,
+    noise_db: int = -35,
+    min_duration: float = 0.4,
+) -> List[tuple]:
+    """
+    Find silent intervals via ffmpeg's silencedetect filter.
+
+    Returns:
+        List of (start, end) second offsets; empty when detection fails
+        or the audio has no silences (e.g. continuous music).
+    """
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg_path,
+                "-i", str(audio_path),
+                "-af", f"silencedetect=n={noise_db}dB:d={min_duration}",
+                "-f", "null", "-",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=3600,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return []
+
+    silences = []
+    start = None
+    for line in result.stderr.splitlines():
+        if "silence_start:" in line:
+            try:
+                start = float(line.split("silence_start:")[1].split()[0])
+            except (ValueError, IndexError):
+                continue
+        elif "silence_end:" in line and start is not None:
+            try:
+                end = float(line.split("silence_end:")[1].split()[0])
+            except (ValueError, IndexError):
+                continue
+            silences.append((start, end))
+            start = None
+    return silences
+
+
+def _aligned_boundaries(
+    total_duration: float,
+    chunk_duration_seconds: int,
+    silences: List[tuple],
+    window: float = 30.0,
+) -> List[float]:
+    """
+    Snap nominal chunk boundaries to the nearest silence midpoint.
+
+    Each k * chunk_duration boundary moves to the closest silence
+    midpoint within +/- window seconds, so chunks cut in pauses instead
+    of mid-word; boundaries with no nearby silence stay where they are.
+    """
+    boundaries = []
+    t = float(chunk_duration_seconds)
+    while t < total_duration:
+        best = None
+        for silence_start, silence_end in silences:
+            mid = (silence_start + silence_end) / 2
+            if abs(mid - t) <= window and (best is None or abs(mid - t) < abs(best - t)):
+                best = mid
+        boundary = best if best is not None else t
+        # Two neighbors can snap to the same pause; segment_times must be
+        # strictly increasing, so drop any boundary that doesn't advance.
+        if not boundaries or boundary > boundaries[-1]:
+            boundaries.append(boundary)
+        t += chunk_duration_seconds
+    return boundaries
+
+
+def _iter_chunks_streaming(
+    audio_path: Path,
+    output_dir: Path,
+    chunk_duration_seconds: int,
+    ffmpeg_path: str = _FFMPEG,
+    poll_interval: float = 0.2,
+    segment_times: Optional[List[float]] = None,
+):
+    """
+    Yield chunk paths as ffmpeg's segment muxer finishes writing them.
+
+    Runs the same one-pass segment command as split_audio but in the
+    background, so transcription of chunk N can start while ffmpeg is
+    still writing chunk N+1. A chunk is known complete once the next
+    chunk file appears (ffmpeg opens them strictly in order) or once
+    ffmpeg has exited.
+
+    Raises:
+        TranscriptionError: If ffmpeg exits non-zero
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    audio_path = Path(audio_path)
+    suffix = _segment_suffix(audio_path)
+
+    proc = subprocess.Popen(
+        _segment_command(
+            audio_path, output_dir, chunk_duration_seconds, ffmpeg_path,
+            segment_times=segment_times,
+        ),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    next_index = 0
+    try:
+        while True:
+            current = output_dir / f"chunk_{next_index:03d}{suffix}"
+            upcoming = output_dir / f"chunk_{next_index + 1:03d}{suffix}"
+            if upcoming.exists():
+                # ffmpeg moved on to the next segment, so this one is closed
+                yield current
+                next_index += 1
+                continue
+            if proc.poll() is not None:
+                break
+            time.sleep(poll_interval)
+
+        if proc.returncode != 0:
+            raise TranscriptionError(
+                f"Failed to split audio (ffmpeg exited {proc.returncode})"
+            )
+
+        # Yield whatever remains now that ffmpeg is done
+        while (output_dir / f"chunk_{next_index:03d}{suffix}").exists():
+            yield output_dir / f"chunk_{next_index:03d}{suffix}"
+            next_index += 1
+
+        if next_index == 0:
+            raise TranscriptionError(f"Splitting produced no chunks for {audio_path}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+# Instructions appended to the prompt for multi-file batch calls
+_BATCH_PROMPT_SUFFIX = """
+
+You are given {count} audio files. Transcribe each file separately following the instructions above, and return a JSON array with one object per file of the form {{"index": <0-based file index>, "text": "<full transcript>"}}, in index order."""
+
+_BATCH_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "index": {"type": "integer"},
+            "text": {"type": "string"},
+        },
+        "required": ["index", "text"],
+    },
+}
+
+
+def _transcribe_batch(
+    chunk_paths: List[Path],
+    prompt: str,
+    api_key: Optional[str],
+    model_name: str,
+) -> List[str]:
+    """
+    Transcribe several chunks in one structured-output API call.
+
+    Amortizes per-request overhead (and rate-limited call count) across
+    the batch; the JSON response schema makes joining deterministic.
+
+    Raises:
+        TranscriptionError: If the call fails or the response doesn't
+                            cover every chunk
+    """
+    configure_gemini(api_key)
+    genai = _require_genai()
+    model = _get_model(model_name)
+
+    parts = [prompt + _BATCH_PROMPT_SUFFIX.format(count=len(chunk_paths))]
+    uploads = []
+    for chunk_path in chunk_paths:
+        mime_type = _MIME_BY_SUFFIX.get(chunk_path.suffix.lower())
+        if mime_type and chunk_path.stat().st_size < _INLINE_MAX_BYTES:
+            parts.append({"mime_type": mime_type, "data": chunk_path.read_bytes()})
+        else:
+            upload = genai.upload_file(str(chunk_path))
+            uploads.append(upload)
+            parts.append(upload)
+
+    try:
+        response = model.generate_content(
+            parts,
+            generation_config=genai.GenerationConfig(
+                temperature=0.1,
+                response_mime_type="application/json",
+                response_schema=_BATCH_RESPONSE_SCHEMA,
+            ),
+        )
+
+        try:
+            items = json.loads(response.text)
+            texts = [None] * len(chunk_paths)
+            for item in items:
+                texts[int(item["index"])] = item["text"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise TranscriptionError(f"Unparseable batch response: {e}")
+
+        if any(text is None for text in texts):
+            raise TranscriptionError("Batch response missing chunk transcripts")
+        return texts
+    except TranscriptionError:
+        raise
+    except Exception as e:
+        raise TranscriptionError(f"Batch transcription failed: {e}")
+    finally:
+        for upload in uploads:
+            _cleanup_pool.submit(_delete_quietly, upload)
+
+
+class _RateLimiter:
+    """Enforces a minimum interval between request starts across threads."""
+
+    def __init__(self, min_interval: float):
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self) -> None:
+        if self._min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._min_interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
 def transcribe_audio_chunked(
     audio_path: Path,
     api_key: Optional[str] = None,
     language: str = "en",
     chunk_duration_minutes: int = 10,
     model_name: str = "gemini-2.5-flash",
-    delay_between_chunks: int = 5,
+    delay_between_chunks: int = 0,
     include_timestamps: bool = False,
     show_progress: bool = True,
+    max_concurrency: int = 4,
+    align_to_silence: bool = False,
+    batch_size: int = 1,
 ) -> str:
     """
     Transcribe long audio files by processing in chunks.
 
     For very long audio files (> 1 hour), this function splits the audio
-    and transcribes each chunk separately.
+    and transcribes the chunks concurrently with a bounded worker pool.
+    delay_between_chunks acts as a minimum interval between request
+    starts, shared across workers, so Gemini's rate limit is respected
+    without serializing the whole pipeline.
 
     Args:
         audio_path: Path to audio file
@@ -290,9 +1193,18 @@ def transcribe_audio_chunked(
         language: Language code
         chunk_duration_minutes: Duration of each chunk in minutes
         model_name: Gemini model to use
-        delay_between_chunks: Seconds to wait between API calls (rate limiting)
+        delay_between_chunks: Minimum seconds between request starts
+                              (0 disables the floor; transient 429s are
+                              handled by retry with backoff instead)
         include_timestamps: Whether to include timestamps in transcript
         show_progress: Whether to print progress messages
+        max_concurrency: Number of chunks transcribed in parallel
+        align_to_silence: Snap chunk boundaries to nearby pauses (one
+                          extra ffmpeg analysis pass) so cuts don't land
+                          mid-word
+        batch_size: Send this many chunks per API call using structured
+                    JSON output (1 = one call per chunk); a failing batch
+                    falls back to per-chunk calls
 
     Returns:
         Full concatenated transcript
@@ -318,8 +1230,8 @@ def transcribe_audio_chunked(
             model_name=model_name,
         )
 
-    # Calculate number of chunks
-    num_chunks = int(total_duration / chunk_duration_seconds) + 1
+    # Calculate number of chunks (exact multiples shouldn't over-count)
+    num_chunks = math.ceil(total_duration / chunk_duration_seconds)
     if show_progress:
         print(f"Audio is {total_duration/60:.1f} minutes, splitting into {num_chunks} chunks...")
 
@@ -327,19 +1239,63 @@ def transcribe_audio_chunked(
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Split audio
+        # Chunks are produced by a background ffmpeg and submitted to the
+        # worker pool as they appear, so segmenting, uploads, and
+        # inference all overlap; results land by index so order is
+        # preserved regardless of completion order.
         if show_progress:
             print("Splitting audio into chunks...")
-        chunks = split_audio(audio_path, temp_path, chunk_duration_seconds)
-
-        if show_progress:
-            print(f"Created {len(chunks)} chunks")
+        limiter = _RateLimiter(delay_between_chunks)
+        prompt = _build_prompt(language, include_timestamps)
+
+        if batch_size > 1:
+            # Batched mode: split synchronously, then issue one structured
+            # call per group of chunks, falling back per-chunk on failure.
+            chunks = split_audio(audio_path, temp_path, chunk_duration_seconds)
+            transcripts = []
+            for batch_start in range(0, len(chunks), batch_size):
+                group = chunks[batch_start:batch_start + batch_size]
+                try:
+                    texts = _transcribe_batch(group, prompt, api_key, model_name)
+                except TranscriptionError as e:
+                    if show_progress:
+                        print(f"  Batch at chunk {batch_start+1} failed ({e}); retrying per chunk")
+                    texts = []
+                    for offset, chunk_path in enumerate(group):
+                        try:
+                            texts.append(
+                                transcribe_audio(
+                                    audio_path=chunk_path,
+                                    api_key=api_key,
+                                    language=language,
+                                    include_timestamps=include_timestamps,
+                                    model_name=model_name,
+                                    prompt=prompt,
+                                )
+                            )
+                        except TranscriptionError:
+                            texts.append(
+                                f"[Transcription failed for chunk {batch_start+offset+1}]"
+                            )
+                transcripts.extend(texts)
+                if show_progress:
+                    print(f"  Chunks {batch_start+1}-{batch_start+len(group)} completed")
 
-        # Transcribe each chunk
-        transcripts = []
-        for i, chunk_path in enumerate(chunks):
+            full_transcript = "\n\n".join(transcripts)
             if show_progress:
-                print(f"Transcribing chunk {i+1}/{len(chunks)}...")
+                print(f"Transcription complete. Total: {len(full_transcript)} chars")
+            return full_transcript
+
+        segment_times = None
+        if align_to_silence:
+            silences = _detect_silences(audio_path)
+            if silences:
+                segment_times = _aligned_boundaries(
+                    total_duration, chunk_duration_seconds, silences
+                )
+
+        def transcribe_chunk(i: int, chunk_path: Path) -> tuple:
+            limiter.wait()
 
             # Calculate chunk start time for timestamp adjustment
             chunk_start_minutes = i * chunk_duration_minutes
@@ -351,32 +1307,74 @@ def transcribe_audio_chunked(
                     language=language,
                     include_timestamps=include_timestamps,
                     model_name=model_name,
+                    prompt=prompt,
                 )
 
                 # Add chunk marker with time offset if using timestamps
                 if include_timestamps and chunk_start_minutes > 0:
                     transcript = f"[Chunk {i+1} - starts at {chunk_start_minutes}:00]\n{transcript}"
 
-                transcripts.append(transcript)
-
-                if show_progress:
-                    print(f"  Chunk {i+1} completed ({len(transcript)} chars)")
-
+                return i, transcript, None
             except TranscriptionError as e:
+                return i, f"[Transcription failed for chunk {i+1}]", e
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = [
+                executor.submit(transcribe_chunk, i, chunk_path)
+                for i, chunk_path in enumerate(
+                    _iter_chunks_streaming(
+                        audio_path, temp_path, chunk_duration_seconds,
+                        segment_times=segment_times,
+                    )
+                )
+            ]
+            transcripts = [None] * len(futures)
+            for future in as_completed(futures):
+                i, transcript, error = future.result()
+                transcripts[i] = transcript
                 if show_progress:
-                    print(f"  Chunk {i+1} failed: {e}")
-                transcripts.append(f"[Transcription failed for chunk {i+1}]")
-
-            # Rate limiting delay between chunks
-            if i < len(chunks) - 1 and delay_between_chunks > 0:
-                if show_progress:
-                    print(f"  Waiting {delay_between_chunks}s before next chunk...")
-                time.sleep(delay_between_chunks)
-
-    # Combine transcripts
-    full_transcript = "\n\n".join(transcripts)
+                    if error is not None:
+                        print(f"  Chunk {i+1} failed: {error}")
+                    else:
+                        print(f"  Chunk {i+1} completed ({len(transcript)} chars)")
+
+    # Combine transcripts incrementally instead of materializing the
+    # full result twice
+    buf = io.StringIO()
+    for transcript in transcripts:
+        buf.write(transcript)
+        buf.write("\n\n")
+    full_transcript = buf.getvalue().rstrip()
 
     if show_progress:
         print(f"Transcription complete. Total: {len(full_transcript)} chars")
 
     return full_transcript
+
+
+async def transcribe_audio_async(audio_path: Path, **kwargs) -> str:
+    """
+    Await a transcription without blocking the caller's event loop.
+
+    The Gemini SDK used here exposes an async generate call but no async
+    file upload, so the work runs on a worker thread via asyncio.to_thread
+    rather than as a native coroutine chain. Accepts the same keyword
+    arguments as transcribe_audio.
+    """
+    import asyncio
+
+    return await asyncio.to_thread(transcribe_audio, audio_path, **kwargs)
+
+
+async def transcribe_audio_chunked_async(audio_path: Path, **kwargs) -> str:
+    """
+    Await a chunked transcription without blocking the caller's event loop.
+
+    Concurrency across chunks is already bounded inside
+    transcribe_audio_chunked (max_concurrency), so this front-end only
+    moves the blocking work off the event loop. Accepts the same keyword
+    arguments as transcribe_audio_chunked.
+    """
+    import asyncio
+
+    return await asyncio.to_thread(transcribe_audio_chunked, audio_path, **kwargs)
@@ -1,8 +1,42 @@
 """Shared pytest fixtures for all tests."""
 
+import io
 import os
-import pytest
 from pathlib import Path
+from types import SimpleNamespace
+
+# Preload the heaviest common dependency once per worker, instead of
+# paying importlib lookups inside individual tests. google.generativeai
+# is deliberately NOT preloaded: the core modules import it lazily and
+# the mocked tests never need the real SDK at all.
+import requests  # noqa: F401
+
+import pytest
+
+from src.core.audio_extractor import check_ffmpeg
+
+
+def fake_requests_response(headers=None, body=b"", status_code=200):
+    """Build a lightweight stand-in for a streaming requests response.
+
+    SimpleNamespace construction is far cheaper than MagicMock's
+    auto-speccing attribute machinery; use this wherever a test doesn't
+    need call assertions.
+    """
+    buf = io.BytesIO(body)
+    return SimpleNamespace(
+        headers=headers or {},
+        status_code=status_code,
+        raw=SimpleNamespace(read=buf.read, readinto=buf.readinto, decode_content=False),
+        raise_for_status=lambda: None,
+        close=lambda: None,
+    )
+
+
+def fake_genai_model(text=""):
+    """Build a minimal GenerativeModel stand-in returning fixed text."""
+    response = SimpleNamespace(text=text)
+    return SimpleNamespace(generate_content=lambda *args, **kwargs: response)
 
 
 # Paths
@@ -10,13 +44,13 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the path to the fixtures directory."""
     return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video(fixtures_dir) -> Path:
     """Return path to sample video file.
 
@@ -28,7 +62,7 @@ def sample_video(fixtures_dir) -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio(fixtures_dir) -> Path:
     """Return path to sample audio file.
 
@@ -40,7 +74,7 @@ def sample_audio(fixtures_dir) -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript(fixtures_dir) -> Path:
     """Return path to sample transcript file.
 
@@ -52,11 +86,75 @@ def sample_transcript(fixtures_dir) -> Path:
     return path
 
 
+@pytest.fixture(scope="session")
+def ffmpeg_available() -> bool:
+    """Whether ffmpeg is installed, probed once per test session."""
+    return check_ffmpeg()
+
+
+@pytest.fixture(scope="session")
+def sample_audio_extracted(sample_video, tmp_path_factory, ffmpeg_available) -> tuple:
+    """(path, duration) of audio extracted from the sample video.
+
+    One combined ffmpeg run per session covers both the extraction and
+    the duration - no follow-up ffprobe spawn.
+    """
+    if not ffmpeg_available:
+        pytest.skip("ffmpeg not installed")
+
+    from src.core.audio_extractor import extract_audio
+
+    output_path = tmp_path_factory.mktemp("shared_media") / "extracted_audio.mp3"
+    return extract_audio(
+        sample_video, output_path, overwrite=True, return_duration=True
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_audio_duration(sample_audio, ffmpeg_available) -> float:
+    """Duration of the sample audio, probed once per session."""
+    if not ffmpeg_available:
+        pytest.skip("ffmpeg not installed")
+
+    from src.core.audio_extractor import get_audio_duration
+
+    return get_audio_duration(sample_audio)
+
+
+@pytest.fixture(scope="session")
+def fake_audio_path(tmp_path_factory) -> Path:
+    """A tiny fake audio file shared by the mocked-API transcriber tests.
+
+    Written once per session instead of once per test; the tests never
+    mutate it.
+    """
+    path = tmp_path_factory.mktemp("shared_fake") / "test.mp3"
+    path.write_bytes(b"fake audio content")
+    return path
+
+
+@pytest.fixture(scope="class")
+def _class_output_dir(tmp_path_factory, request) -> Path:
+    """One temporary base directory per test class.
+
+    pytest's tmp_path machinery (numbered dir + retention bookkeeping)
+    runs once per class instead of once per test; everything is swept
+    together at the end of the session.
+    """
+    name = request.cls.__name__ if request.cls else "shared"
+    return tmp_path_factory.mktemp(name)
+
+
 @pytest.fixture
-def temp_output_dir(tmp_path) -> Path:
-    """Return a temporary output directory for test outputs."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir(parents=True, exist_ok=True)
+def temp_output_dir(_class_output_dir, request) -> Path:
+    """Return a temporary output directory for test outputs.
+
+    A per-test subdirectory (one cheap mkdir) of the class base keeps
+    tests isolated from each other's files.
+    """
+    safe_name = request.node.name.replace("[", "_").replace("]", "")
+    output_dir = _class_output_dir / safe_name
+    output_dir.mkdir(exist_ok=True)
     return output_dir
 
 
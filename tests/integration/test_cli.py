@@ -94,7 +94,7 @@ class TestCLI:
 class TestDownloadCommand:
     """Tests for download command."""
 
-    @patch("src.cli.download_clubhouse_video")
+    @patch("src.core.downloader.download_clubhouse_video")
     def test_download_success(self, mock_download, tmp_path):
         """Test successful download."""
         mock_download.return_value = tmp_path / "video.mp4"
@@ -109,7 +109,7 @@ class TestDownloadCommand:
         assert result.exit_code == 0
         assert "Downloaded to" in result.output
 
-    @patch("src.cli.download_clubhouse_video")
+    @patch("src.core.downloader.download_clubhouse_video")
     def test_download_invalid_url(self, mock_download):
         """Test download with invalid URL."""
         from src.core.downloader import DownloadError
@@ -128,7 +128,7 @@ class TestDownloadCommand:
 class TestExtractCommand:
     """Tests for extract command."""
 
-    @patch("src.cli.extract_audio")
+    @patch("src.core.audio_extractor.extract_audio")
     def test_extract_success(self, mock_extract, tmp_path):
         """Test successful extraction."""
         # Create dummy input file
@@ -160,7 +160,7 @@ class TestExtractCommand:
 class TestTranscribeCommand:
     """Tests for transcribe command."""
 
-    @patch("src.cli.transcribe_audio")
+    @patch("src.core.transcriber.transcribe_audio")
     @patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
     def test_transcribe_success(self, mock_transcribe, tmp_path):
         """Test successful transcription."""
@@ -204,7 +204,7 @@ class TestTranscribeCommand:
 class TestSummarizeCommand:
     """Tests for summarize command."""
 
-    @patch("src.cli.generate_descriptions")
+    @patch("src.core.summarizer.generate_descriptions")
     @patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
     def test_summarize_success(self, mock_generate, tmp_path):
         """Test successful summary generation."""
@@ -236,10 +236,10 @@ class TestSummarizeCommand:
 class TestProcessCommand:
     """Tests for process command (full pipeline)."""
 
-    @patch("src.cli.generate_descriptions")
-    @patch("src.cli.transcribe_audio")
-    @patch("src.cli.extract_audio")
-    @patch("src.cli.download_clubhouse_video")
+    @patch("src.core.summarizer.generate_descriptions")
+    @patch("src.core.transcriber.transcribe_audio")
+    @patch("src.core.audio_extractor.extract_audio")
+    @patch("src.core.downloader.download_clubhouse_video")
     @patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
     def test_process_full_pipeline(
         self, mock_download, mock_extract, mock_transcribe, mock_generate, tmp_path
@@ -1,8 +1,10 @@
 """Unit tests for audio_extractor module."""
 
+import re
 import subprocess
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch, Mock, MagicMock
 
 import pytest
 
@@ -13,6 +15,17 @@ from src.core.audio_extractor import (
     AudioExtractionError,
 )
 
+# Expected-error patterns, compiled once per module instead of
+# per pytest.raises call
+_ERR_VIDEO_NOT_FOUND = re.compile(r"Video file not found")
+_ERR_NOT_A_FILE = re.compile(r"Path is not a file")
+_ERR_FFMPEG_MISSING = re.compile(r"ffmpeg not found")
+_ERR_ALREADY_EXISTS = re.compile(r"already exists")
+_ERR_EXTRACTION_FAILED = re.compile(r"ffmpeg extraction failed")
+_ERR_TIMED_OUT = re.compile(r"timed out")
+_ERR_FFPROBE_FAILED = re.compile(r"ffprobe failed")
+_ERR_DURATION_FAILED = re.compile(r"Failed to get audio duration")
+
 
 class TestCheckFfmpeg:
     """Tests for check_ffmpeg function."""
@@ -31,12 +44,20 @@ class TestCheckFfmpeg:
         result = check_ffmpeg("/nonexistent/path/to/ffmpeg")
         assert result is False
 
+    @patch("src.core.audio_extractor.shutil.which")
     @patch("subprocess.run")
-    def test_ffmpeg_check_with_mock(self, mock_run):
+    def test_ffmpeg_check_with_mock(self, mock_run, mock_which):
         """Test ffmpeg check with mocked subprocess."""
+        check_ffmpeg.cache_clear()
+        mock_which.return_value = "/usr/bin/ffmpeg"
         mock_run.return_value = MagicMock(returncode=0)
-        assert check_ffmpeg() is True
-        mock_run.assert_called_once()
+        try:
+            assert check_ffmpeg() is True
+            mock_run.assert_called_once()
+        finally:
+            # Always drop the mocked probe result, even on failure -
+            # a poisoned cache would leak into every later test
+            check_ffmpeg.cache_clear()
 
 
 class TestExtractAudio:
@@ -46,34 +67,32 @@ class TestExtractAudio:
         """Test that FileNotFoundError is raised for missing input."""
         fake_path = temp_output_dir / "nonexistent.mp4"
 
-        with pytest.raises(FileNotFoundError, match="Video file not found"):
+        with pytest.raises(FileNotFoundError, match=_ERR_VIDEO_NOT_FOUND):
             extract_audio(fake_path)
 
     def test_extract_audio_path_is_directory(self, temp_output_dir):
         """Test that FileNotFoundError is raised when path is a directory."""
-        with pytest.raises(FileNotFoundError, match="Path is not a file"):
+        with pytest.raises(FileNotFoundError, match=_ERR_NOT_A_FILE):
             extract_audio(temp_output_dir)
 
-    @patch("src.core.audio_extractor.check_ffmpeg")
-    def test_extract_audio_ffmpeg_not_available(
-        self, mock_check, temp_output_dir
-    ):
+    def test_extract_audio_ffmpeg_not_available(self, monkeypatch, temp_output_dir):
         """Test that AudioExtractionError is raised when ffmpeg is missing."""
-        mock_check.return_value = False
+        monkeypatch.setattr(
+            "src.core.audio_extractor.check_ffmpeg", lambda *a, **k: False
+        )
 
         # Create a dummy video file
         video_path = temp_output_dir / "test.mp4"
         video_path.write_bytes(b"fake video content")
 
-        with pytest.raises(AudioExtractionError, match="ffmpeg not found"):
+        with pytest.raises(AudioExtractionError, match=_ERR_FFMPEG_MISSING):
             extract_audio(video_path)
 
-    @patch("src.core.audio_extractor.check_ffmpeg")
-    def test_extract_audio_output_exists_no_overwrite(
-        self, mock_check, temp_output_dir
-    ):
+    def test_extract_audio_output_exists_no_overwrite(self, monkeypatch, temp_output_dir):
         """Test that error is raised when output exists and overwrite=False."""
-        mock_check.return_value = True
+        monkeypatch.setattr(
+            "src.core.audio_extractor.check_ffmpeg", lambda *a, **k: True
+        )
 
         # Create dummy input and output files
         video_path = temp_output_dir / "test.mp4"
@@ -81,67 +100,70 @@ class TestExtractAudio:
         output_path = temp_output_dir / "test.mp3"
         output_path.write_bytes(b"existing audio")
 
-        with pytest.raises(AudioExtractionError, match="already exists"):
+        with pytest.raises(AudioExtractionError, match=_ERR_ALREADY_EXISTS):
             extract_audio(video_path, output_path, overwrite=False)
 
-    @patch("subprocess.run")
-    @patch("src.core.audio_extractor.check_ffmpeg")
-    def test_extract_audio_ffmpeg_failure(
-        self, mock_check, mock_run, temp_output_dir
-    ):
+    def test_extract_audio_ffmpeg_failure(self, monkeypatch, temp_output_dir):
         """Test handling of ffmpeg extraction failure."""
-        mock_check.return_value = True
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stderr="Error: invalid input file"
+        monkeypatch.setattr(
+            "src.core.audio_extractor.check_ffmpeg", lambda *a, **k: True
+        )
+        monkeypatch.setattr(
+            "subprocess.Popen",
+            lambda *a, **k: SimpleNamespace(
+                stderr=["Error: invalid input file\n"],
+                wait=lambda timeout=None: 1,
+            ),
         )
 
         video_path = temp_output_dir / "test.mp4"
         video_path.write_bytes(b"fake video content")
 
-        with pytest.raises(AudioExtractionError, match="ffmpeg extraction failed"):
-            extract_audio(video_path)
+        with pytest.raises(AudioExtractionError, match=_ERR_EXTRACTION_FAILED):
+            extract_audio(video_path, prefer_copy=False)
 
-    @patch("subprocess.run")
-    @patch("src.core.audio_extractor.check_ffmpeg")
-    def test_extract_audio_timeout(
-        self, mock_check, mock_run, temp_output_dir
-    ):
+    def test_extract_audio_timeout(self, monkeypatch, temp_output_dir):
         """Test handling of ffmpeg timeout."""
-        mock_check.return_value = True
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="ffmpeg", timeout=3600)
+        monkeypatch.setattr(
+            "src.core.audio_extractor.check_ffmpeg", lambda *a, **k: True
+        )
+        monkeypatch.setattr(
+            "subprocess.Popen",
+            lambda *a, **k: SimpleNamespace(
+                stderr=[],
+                wait=Mock(
+                    side_effect=[subprocess.TimeoutExpired(cmd="ffmpeg", timeout=3600), 0]
+                ),
+                kill=lambda: None,
+            ),
+        )
 
         video_path = temp_output_dir / "test.mp4"
         video_path.write_bytes(b"fake video content")
 
-        with pytest.raises(AudioExtractionError, match="timed out"):
-            extract_audio(video_path)
+        with pytest.raises(AudioExtractionError, match=_ERR_TIMED_OUT):
+            extract_audio(video_path, prefer_copy=False)
 
-    def test_extract_audio_with_real_file(self, sample_video, temp_output_dir):
+    def test_extract_audio_with_real_file(self, sample_audio_extracted):
         """Test actual audio extraction with a real video file.
 
         This test requires:
         1. ffmpeg to be installed
         2. A sample video at tests/fixtures/sample_video.mp4
-        """
-        if not check_ffmpeg():
-            pytest.skip("ffmpeg not installed")
-
-        output_path = temp_output_dir / "extracted_audio.mp3"
-
-        result = extract_audio(
-            sample_video,
-            output_path,
-            overwrite=True,
-        )
 
-        assert result == output_path
-        assert result.exists()
-        assert result.stat().st_size > 0
+        The extraction itself runs once per session via the shared
+        fixture; this test asserts on the produced artifact and the
+        duration reported by the same ffmpeg run.
+        """
+        audio_path, duration = sample_audio_extracted
+        assert audio_path.exists()
+        assert audio_path.suffix == ".mp3"
+        assert audio_path.stat().st_size > 0
+        assert duration is None or duration > 0
 
-    def test_extract_audio_default_output_path(self, sample_video, temp_output_dir):
+    def test_extract_audio_default_output_path(self, sample_video, temp_output_dir, ffmpeg_available):
         """Test that default output path uses .mp3 extension."""
-        if not check_ffmpeg():
+        if not ffmpeg_available:
             pytest.skip("ffmpeg not installed")
 
         # Copy sample to temp dir to avoid polluting fixtures
@@ -159,15 +181,10 @@ class TestExtractAudio:
 class TestGetAudioDuration:
     """Tests for get_audio_duration function."""
 
-    def test_get_duration_with_real_file(self, sample_audio):
+    def test_get_duration_with_real_file(self, sample_audio_duration):
         """Test getting duration from a real audio file."""
-        if not check_ffmpeg():
-            pytest.skip("ffmpeg not installed")
-
-        duration = get_audio_duration(sample_audio)
-
-        assert isinstance(duration, float)
-        assert duration > 0
+        assert isinstance(sample_audio_duration, float)
+        assert sample_audio_duration > 0
 
     @patch("subprocess.run")
     def test_get_duration_ffprobe_failure(self, mock_run, temp_output_dir):
@@ -180,7 +197,7 @@ class TestGetAudioDuration:
         audio_path = temp_output_dir / "test.mp3"
         audio_path.write_bytes(b"fake audio")
 
-        with pytest.raises(AudioExtractionError, match="ffprobe failed"):
+        with pytest.raises(AudioExtractionError, match=_ERR_FFPROBE_FAILED):
             get_audio_duration(audio_path)
 
     @patch("subprocess.run")
@@ -194,5 +211,5 @@ class TestGetAudioDuration:
         audio_path = temp_output_dir / "test.mp3"
         audio_path.write_bytes(b"fake audio")
 
-        with pytest.raises(AudioExtractionError, match="Failed to get audio duration"):
+        with pytest.raises(AudioExtractionError, match=_ERR_DURATION_FAILED):
             get_audio_duration(audio_path)
@@ -1,17 +1,31 @@
 """Unit tests for downloader module."""
 
+import re
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
+import requests
+
+from tests.conftest import fake_requests_response
 
 from src.core.downloader import (
     download_clubhouse_video,
+    download_many,
     validate_url,
     sanitize_filename,
     DownloadError,
 )
 
+# Expected-error patterns, compiled once per module instead of
+# per pytest.raises call
+_ERR_INVALID_URL = re.compile(r"Invalid URL")
+_ERR_TIMED_OUT = re.compile(r"timed out")
+_ERR_HTTP = re.compile(r"HTTP error")
+_ERR_CONNECTION = re.compile(r"Connection error")
+_ERR_FIXED_FILENAME = re.compile(r"filename cannot be combined")
+_ERR_NAME_COLLISION = re.compile(r"same output filename")
+
 
 class TestValidateUrl:
     """Tests for validate_url function."""
@@ -77,23 +91,21 @@ class TestDownloadClubhouseVideo:
 
     def test_download_invalid_url(self, temp_output_dir):
         """Test that invalid URL raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid URL"):
+        with pytest.raises(ValueError, match=_ERR_INVALID_URL):
             download_clubhouse_video("not-a-url", temp_output_dir)
 
     def test_download_empty_url(self, temp_output_dir):
         """Test that empty URL raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid URL"):
+        with pytest.raises(ValueError, match=_ERR_INVALID_URL):
             download_clubhouse_video("", temp_output_dir)
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_success(self, mock_get, temp_output_dir):
         """Test successful download."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content.return_value = [b"fake video content"]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_requests_response(
+            headers={"content-length": "1000"}, body=b"fake video content"
+        )
 
         result = download_clubhouse_video(
             "https://example.com/recording.mp4",
@@ -104,14 +116,12 @@ class TestDownloadClubhouseVideo:
         assert result.exists()
         assert result.suffix == ".mp4"
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_with_custom_filename(self, mock_get, temp_output_dir):
         """Test download with custom filename."""
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content.return_value = [b"fake video content"]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_requests_response(
+            headers={"content-length": "1000"}, body=b"fake video content"
+        )
 
         result = download_clubhouse_video(
             "https://example.com/video",
@@ -122,56 +132,48 @@ class TestDownloadClubhouseVideo:
 
         assert result.name == "my_episode.mp4"
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_timeout(self, mock_get, temp_output_dir):
         """Test download timeout handling."""
-        import requests
-
         mock_get.side_effect = requests.exceptions.Timeout()
 
-        with pytest.raises(DownloadError, match="timed out"):
+        with pytest.raises(DownloadError, match=_ERR_TIMED_OUT):
             download_clubhouse_video(
                 "https://example.com/video.mp4",
                 temp_output_dir,
             )
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_http_error(self, mock_get, temp_output_dir):
         """Test HTTP error handling."""
-        import requests
-
         mock_response = MagicMock()
         mock_response.status_code = 404
         error = requests.exceptions.HTTPError(response=mock_response)
         mock_get.return_value.raise_for_status.side_effect = error
 
-        with pytest.raises(DownloadError, match="HTTP error"):
+        with pytest.raises(DownloadError, match=_ERR_HTTP):
             download_clubhouse_video(
                 "https://example.com/video.mp4",
                 temp_output_dir,
             )
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_connection_error(self, mock_get, temp_output_dir):
         """Test connection error handling."""
-        import requests
-
         mock_get.side_effect = requests.exceptions.ConnectionError()
 
-        with pytest.raises(DownloadError, match="Connection error"):
+        with pytest.raises(DownloadError, match=_ERR_CONNECTION):
             download_clubhouse_video(
                 "https://example.com/video.mp4",
                 temp_output_dir,
             )
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_creates_output_directory(self, mock_get, tmp_path):
         """Test that output directory is created if it doesn't exist."""
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content.return_value = [b"fake video content"]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_requests_response(
+            headers={"content-length": "1000"}, body=b"fake video content"
+        )
 
         nested_dir = tmp_path / "nested" / "output" / "dir"
 
@@ -184,14 +186,12 @@ class TestDownloadClubhouseVideo:
         assert nested_dir.exists()
         assert result.exists()
 
-    @patch("src.core.downloader.requests.get")
+    @patch("src.core.downloader._SESSION.get")
     def test_download_extracts_filename_from_url(self, mock_get, temp_output_dir):
         """Test that filename is extracted from URL path."""
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content.return_value = [b"fake video content"]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_requests_response(
+            headers={"content-length": "1000"}, body=b"fake video content"
+        )
 
         result = download_clubhouse_video(
             "https://example.com/path/to/my_recording.mp4?token=abc",
@@ -200,3 +200,38 @@ class TestDownloadClubhouseVideo:
         )
 
         assert "my_recording" in result.name
+
+
+class TestDownloadMany:
+    """Tests for download_many function."""
+
+    def test_rejects_fixed_filename_with_multiple_urls(self, temp_output_dir):
+        """Test that one filename across several URLs is refused."""
+        with pytest.raises(ValueError, match=_ERR_FIXED_FILENAME):
+            download_many(
+                ["https://a.example.com/x.mp4", "https://b.example.com/y.mp4"],
+                temp_output_dir,
+                filename="episode",
+            )
+
+    def test_rejects_colliding_derived_filenames(self, temp_output_dir):
+        """Test that two URLs sharing a basename are refused up front."""
+        with pytest.raises(ValueError, match=_ERR_NAME_COLLISION):
+            download_many(
+                [
+                    "https://cdn-a.example.com/ep/recording.mp4",
+                    "https://cdn-b.example.com/ep/recording.mp4",
+                ],
+                temp_output_dir,
+            )
+
+    def test_collision_check_normalizes_extension(self, temp_output_dir):
+        """Test that 'recording' and 'recording.mp4' count as one target."""
+        with pytest.raises(ValueError, match=_ERR_NAME_COLLISION):
+            download_many(
+                [
+                    "https://cdn-a.example.com/ep/recording",
+                    "https://cdn-b.example.com/ep/recording.mp4",
+                ],
+                temp_output_dir,
+            )
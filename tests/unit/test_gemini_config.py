@@ -0,0 +1,57 @@
+"""Parametrized tests for configure_gemini across the Gemini-backed modules."""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core import summarizer, transcriber
+from src.core.summarizer import SummaryError
+from src.core.transcriber import TranscriptionError
+
+# Expected-error patterns, compiled once per module instead of
+# per pytest.raises call
+_ERR_NO_API_KEY = re.compile(r"API key not provided")
+
+
+# (module, module-specific error) pairs; the helpers are intentionally
+# parallel implementations, so they share one test class.
+_MODULES = [
+    pytest.param(transcriber, TranscriptionError, id="transcriber"),
+    pytest.param(summarizer, SummaryError, id="summarizer"),
+]
+
+
+class TestConfigureGemini:
+    """Tests for the configure_gemini helpers."""
+
+    @pytest.mark.parametrize("module,error", _MODULES)
+    def test_configure_with_api_key(self, module, error, monkeypatch):
+        """Test configuration with explicit API key."""
+        mock_genai = MagicMock()
+        monkeypatch.setattr(module, "genai", mock_genai)
+
+        module.configure_gemini("test-api-key")
+
+        mock_genai.configure.assert_called_once()
+        assert mock_genai.configure.call_args.kwargs["api_key"] == "test-api-key"
+
+    @pytest.mark.parametrize("module,error", _MODULES)
+    def test_configure_from_env(self, module, error, monkeypatch):
+        """Test configuration from environment variable."""
+        mock_genai = MagicMock()
+        monkeypatch.setattr(module, "genai", mock_genai)
+        monkeypatch.setenv("GEMINI_API_KEY", "env-api-key")
+
+        module.configure_gemini()
+
+        mock_genai.configure.assert_called_once()
+        assert mock_genai.configure.call_args.kwargs["api_key"] == "env-api-key"
+
+    @pytest.mark.parametrize("module,error", _MODULES)
+    def test_configure_no_key_raises_error(self, module, error, monkeypatch):
+        """Test that a missing API key raises the module's error."""
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+        with pytest.raises(error, match=_ERR_NO_API_KEY):
+            module.configure_gemini()
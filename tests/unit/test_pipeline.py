@@ -0,0 +1,84 @@
+"""Unit tests for pipeline module."""
+
+import subprocess
+
+import pytest
+
+from tests.conftest import fake_requests_response
+
+from src.core.pipeline import download_and_extract_audio
+
+
+@pytest.fixture(scope="session")
+def moov_at_end_video(tmp_path_factory, ffmpeg_available):
+    """A large-ish MP4 whose moov atom sits at the end (no faststart).
+
+    This is the layout ffmpeg cannot demux from a pipe: it reads the
+    whole stream, finds no moov in its probe window, and exits 0 with a
+    header-only output file.
+    """
+    if not ffmpeg_available:
+        pytest.skip("ffmpeg not installed")
+
+    path = tmp_path_factory.mktemp("moov") / "slow_start.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-y",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=60",
+            "-c:a", "aac",
+            str(path),
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return path
+
+
+class TestDownloadAndExtractAudio:
+    """Tests for the fused streaming download/extract pass."""
+
+    def test_invalid_url(self, temp_output_dir):
+        """Test that invalid URL raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid URL"):
+            download_and_extract_audio("not-a-url", temp_output_dir)
+
+    def test_moov_at_end_falls_back(self, monkeypatch, moov_at_end_video, temp_output_dir):
+        """A non-faststart MP4 must fall back, not return a broken file.
+
+        ffmpeg exits 0 on the failed stdin demux, so the fallback hinges
+        on validating the streaming output rather than the exit code.
+        """
+        video_bytes = moov_at_end_video.read_bytes()
+        responses = iter(
+            [
+                # Streaming pass consumes this body through ffmpeg's stdin
+                fake_requests_response(
+                    headers={"content-length": str(len(video_bytes))},
+                    body=video_bytes,
+                ),
+                # Fallback re-fetches for the sequential download
+                fake_requests_response(
+                    headers={"content-length": str(len(video_bytes))},
+                    body=video_bytes,
+                ),
+            ]
+        )
+        monkeypatch.setattr(
+            "src.core.downloader._SESSION.get",
+            lambda *args, **kwargs: next(responses),
+        )
+
+        video_path, audio_path = download_and_extract_audio(
+            "https://example.com/slow_start.mp4",
+            temp_output_dir,
+        )
+
+        # The fallback path ran: a video file was written and the audio
+        # is genuinely playable, not a header-only stub.
+        assert video_path is not None
+        assert video_path.exists()
+        assert audio_path.exists()
+
+        from src.core.transcriber import get_audio_duration
+
+        assert get_audio_duration(audio_path) > 1
@@ -1,42 +1,25 @@
 """Unit tests for summarizer module."""
 
-import os
-from unittest.mock import patch, MagicMock
+import re
+from unittest.mock import MagicMock
 
 import pytest
 
+from tests.conftest import fake_genai_model
+
 from src.core.summarizer import (
     generate_descriptions,
-    configure_gemini,
     _parse_response,
     _parse_tags,
     SummaryError,
 )
 
-
-class TestConfigureGemini:
-    """Tests for configure_gemini function."""
-
-    @patch("src.core.summarizer.genai.configure")
-    def test_configure_with_api_key(self, mock_configure):
-        """Test configuration with explicit API key."""
-        configure_gemini("test-api-key")
-        mock_configure.assert_called_once_with(api_key="test-api-key")
-
-    @patch.dict(os.environ, {"GEMINI_API_KEY": "env-api-key"})
-    @patch("src.core.summarizer.genai.configure")
-    def test_configure_from_env(self, mock_configure):
-        """Test configuration from environment variable."""
-        configure_gemini()
-        mock_configure.assert_called_once_with(api_key="env-api-key")
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_configure_no_key_raises_error(self):
-        """Test that missing API key raises SummaryError."""
-        os.environ.pop("GEMINI_API_KEY", None)
-
-        with pytest.raises(SummaryError, match="API key not provided"):
-            configure_gemini()
+# Expected-error patterns, compiled once per module instead of
+# per pytest.raises call
+_ERR_EMPTY_TRANSCRIPT = re.compile(r"Transcript is empty")
+_ERR_EMPTY_TITLE = re.compile(r"Episode title is empty")
+_ERR_EMPTY_RESPONSE = re.compile(r"empty response")
+_ERR_GENERATION_FAILED = re.compile(r"Summary generation failed")
 
 
 class TestGenerateDescriptions:
@@ -44,29 +27,27 @@ class TestGenerateDescriptions:
 
     def test_empty_transcript_raises_error(self):
         """Test that empty transcript raises SummaryError."""
-        with pytest.raises(SummaryError, match="Transcript is empty"):
+        with pytest.raises(SummaryError, match=_ERR_EMPTY_TRANSCRIPT):
             generate_descriptions("", "Episode Title", api_key="test-key")
 
     def test_empty_title_raises_error(self):
         """Test that empty title raises SummaryError."""
-        with pytest.raises(SummaryError, match="Episode title is empty"):
+        with pytest.raises(SummaryError, match=_ERR_EMPTY_TITLE):
             generate_descriptions("Some transcript", "", api_key="test-key")
 
-    @patch("src.core.summarizer.genai")
-    def test_generate_success(self, mock_genai):
+    def test_generate_success(self, monkeypatch):
         """Test successful description generation."""
-        mock_response = MagicMock()
-        mock_response.text = """YOUTUBE_TITLE: Great Episode About Tech
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.summarizer.genai", mock_genai)
+        mock_genai.GenerativeModel.return_value = fake_genai_model(
+            """YOUTUBE_TITLE: Great Episode About Tech
 YOUTUBE_DESCRIPTION: This is a great episode about technology.
 - Topic 1
 - Topic 2
 SPOTIFY_TITLE: Tech Talk Episode
 SPOTIFY_DESCRIPTION: A conversational episode about tech trends.
 TAGS: technology, podcast, innovation, startup"""
-
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
+        )
 
         result = generate_descriptions(
             "This is a transcript about technology...",
@@ -79,19 +60,17 @@ TAGS: technology, podcast, innovation, startup"""
         assert result["spotify_title"] == "Tech Talk Episode"
         assert len(result["tags"]) > 0
 
-    @patch("src.core.summarizer.genai")
-    def test_generate_without_tags(self, mock_genai):
+    def test_generate_without_tags(self, monkeypatch):
         """Test generation with tags disabled."""
-        mock_response = MagicMock()
-        mock_response.text = """YOUTUBE_TITLE: Test Title
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.summarizer.genai", mock_genai)
+        mock_genai.GenerativeModel.return_value = fake_genai_model(
+            """YOUTUBE_TITLE: Test Title
 YOUTUBE_DESCRIPTION: Test description.
 SPOTIFY_TITLE: Test Title
 SPOTIFY_DESCRIPTION: Test description.
 TAGS: tag1, tag2"""
-
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
+        )
 
         result = generate_descriptions(
             "Transcript text",
@@ -102,29 +81,26 @@ TAGS: tag1, tag2"""
 
         assert result["tags"] == []
 
-    @patch("src.core.summarizer.genai")
-    def test_generate_empty_response(self, mock_genai):
+    def test_generate_empty_response(self, monkeypatch):
         """Test handling of empty API response."""
-        mock_response = MagicMock()
-        mock_response.text = ""
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.summarizer.genai", mock_genai)
+        mock_genai.GenerativeModel.return_value = fake_genai_model("")
 
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
-
-        with pytest.raises(SummaryError, match="empty response"):
+        with pytest.raises(SummaryError, match=_ERR_EMPTY_RESPONSE):
             generate_descriptions(
                 "Transcript text",
                 "Episode 1",
                 api_key="test-key",
             )
 
-    @patch("src.core.summarizer.genai")
-    def test_generate_api_error(self, mock_genai):
+    def test_generate_api_error(self, monkeypatch):
         """Test handling of API errors."""
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.summarizer.genai", mock_genai)
         mock_genai.GenerativeModel.side_effect = Exception("API error")
 
-        with pytest.raises(SummaryError, match="Summary generation failed"):
+        with pytest.raises(SummaryError, match=_ERR_GENERATION_FAILED):
             generate_descriptions(
                 "Transcript text",
                 "Episode 1",
@@ -161,6 +137,15 @@ TAGS: tag1, tag2, tag3"""
         assert result["spotify_title"] == "Fallback Title"
         assert "Only description" in result["youtube_description"]
 
+    def test_parse_empty_field_keeps_fallback(self):
+        """An empty-valued header must not swallow the next field's header."""
+        response = "SPOTIFY_TITLE:\nSPOTIFY_DESCRIPTION: desc"
+
+        result = _parse_response(response, "Fallback", True)
+
+        assert result["spotify_title"] == "Fallback"
+        assert result["spotify_description"] == "desc"
+
     def test_parse_empty_response(self):
         """Test parsing empty response."""
         result = _parse_response("", "Fallback", True)
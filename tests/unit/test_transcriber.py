@@ -1,42 +1,23 @@
 """Unit tests for transcriber module."""
 
-import os
+import re
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
 from src.core.transcriber import (
     transcribe_audio,
-    configure_gemini,
     TranscriptionError,
+    _GRPC_COMPRESSION_METADATA,
 )
 
-
-class TestConfigureGemini:
-    """Tests for configure_gemini function."""
-
-    @patch("src.core.transcriber.genai.configure")
-    def test_configure_with_api_key(self, mock_configure):
-        """Test configuration with explicit API key."""
-        configure_gemini("test-api-key")
-        mock_configure.assert_called_once_with(api_key="test-api-key")
-
-    @patch.dict(os.environ, {"GEMINI_API_KEY": "env-api-key"})
-    @patch("src.core.transcriber.genai.configure")
-    def test_configure_from_env(self, mock_configure):
-        """Test configuration from environment variable."""
-        configure_gemini()
-        mock_configure.assert_called_once_with(api_key="env-api-key")
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_configure_no_key_raises_error(self):
-        """Test that missing API key raises TranscriptionError."""
-        # Remove GEMINI_API_KEY if it exists
-        os.environ.pop("GEMINI_API_KEY", None)
-
-        with pytest.raises(TranscriptionError, match="API key not provided"):
-            configure_gemini()
+# Expected-error patterns, compiled once per module instead of
+# per pytest.raises call
+_ERR_AUDIO_NOT_FOUND = re.compile(r"Audio file not found")
+_ERR_NOT_A_FILE = re.compile(r"Path is not a file")
+_ERR_EMPTY_RESPONSE = re.compile(r"empty response")
+_ERR_TRANSCRIPTION_FAILED = re.compile(r"Transcription failed")
 
 
 class TestTranscribeAudio:
@@ -46,20 +27,19 @@ class TestTranscribeAudio:
         """Test that FileNotFoundError is raised for missing input."""
         fake_path = temp_output_dir / "nonexistent.mp3"
 
-        with pytest.raises(FileNotFoundError, match="Audio file not found"):
+        with pytest.raises(FileNotFoundError, match=_ERR_AUDIO_NOT_FOUND):
             transcribe_audio(fake_path, api_key="test-key")
 
     def test_transcribe_path_is_directory(self, temp_output_dir):
         """Test that FileNotFoundError is raised when path is a directory."""
-        with pytest.raises(FileNotFoundError, match="Path is not a file"):
+        with pytest.raises(FileNotFoundError, match=_ERR_NOT_A_FILE):
             transcribe_audio(temp_output_dir, api_key="test-key")
 
-    @patch("src.core.transcriber.genai")
-    def test_transcribe_success(self, mock_genai, temp_output_dir):
+    def test_transcribe_success(self, monkeypatch, fake_audio_path):
         """Test successful transcription with mocked API."""
-        # Create a dummy audio file
-        audio_path = temp_output_dir / "test.mp3"
-        audio_path.write_bytes(b"fake audio content")
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.transcriber.genai", mock_genai)
+        audio_path = fake_audio_path
 
         # Mock the API responses
         mock_file = MagicMock()
@@ -72,18 +52,24 @@ class TestTranscribeAudio:
         mock_model.generate_content.return_value = mock_response
         mock_genai.GenerativeModel.return_value = mock_model
 
-        result = transcribe_audio(audio_path, api_key="test-key")
+        result = transcribe_audio(audio_path, api_key="test-key", no_cache=True)
 
         assert result == "This is the transcribed text."
-        mock_genai.configure.assert_called_once_with(api_key="test-key")
-        mock_genai.upload_file.assert_called_once()
+        mock_genai.configure.assert_called_once_with(
+            api_key="test-key", default_metadata=_GRPC_COMPRESSION_METADATA
+        )
+        # Small files are sent inline with the generate call, not uploaded
+        mock_genai.upload_file.assert_not_called()
         mock_model.generate_content.assert_called_once()
+        media = mock_model.generate_content.call_args[0][0][1]
+        assert media["mime_type"] == "audio/mpeg"
+        assert media["data"] == b"fake audio content"
 
-    @patch("src.core.transcriber.genai")
-    def test_transcribe_with_timestamps(self, mock_genai, temp_output_dir):
+    def test_transcribe_with_timestamps(self, monkeypatch, fake_audio_path):
         """Test transcription with timestamps option."""
-        audio_path = temp_output_dir / "test.mp3"
-        audio_path.write_bytes(b"fake audio content")
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.transcriber.genai", mock_genai)
+        audio_path = fake_audio_path
 
         mock_file = MagicMock()
         mock_genai.upload_file.return_value = mock_file
@@ -99,6 +85,7 @@ class TestTranscribeAudio:
             audio_path,
             api_key="test-key",
             include_timestamps=True,
+            no_cache=True,
         )
 
         assert "[00:00]" in result
@@ -108,11 +95,11 @@ class TestTranscribeAudio:
         prompt = call_args[0][0][0]  # First arg, first element
         assert "timestamp" in prompt.lower()
 
-    @patch("src.core.transcriber.genai")
-    def test_transcribe_empty_response(self, mock_genai, temp_output_dir):
+    def test_transcribe_empty_response(self, monkeypatch, fake_audio_path):
         """Test handling of empty API response."""
-        audio_path = temp_output_dir / "test.mp3"
-        audio_path.write_bytes(b"fake audio content")
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.transcriber.genai", mock_genai)
+        audio_path = fake_audio_path
 
         mock_file = MagicMock()
         mock_genai.upload_file.return_value = mock_file
@@ -124,25 +111,27 @@ class TestTranscribeAudio:
         mock_model.generate_content.return_value = mock_response
         mock_genai.GenerativeModel.return_value = mock_model
 
-        with pytest.raises(TranscriptionError, match="empty response"):
-            transcribe_audio(audio_path, api_key="test-key")
+        with pytest.raises(TranscriptionError, match=_ERR_EMPTY_RESPONSE):
+            transcribe_audio(audio_path, api_key="test-key", no_cache=True)
 
-    @patch("src.core.transcriber.genai")
-    def test_transcribe_api_error(self, mock_genai, temp_output_dir):
+    def test_transcribe_api_error(self, monkeypatch, fake_audio_path):
         """Test handling of API errors."""
-        audio_path = temp_output_dir / "test.mp3"
-        audio_path.write_bytes(b"fake audio content")
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.transcriber.genai", mock_genai)
+        audio_path = fake_audio_path
 
-        mock_genai.upload_file.side_effect = Exception("API error occurred")
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = Exception("API error occurred")
+        mock_genai.GenerativeModel.return_value = mock_model
 
-        with pytest.raises(TranscriptionError, match="Transcription failed"):
-            transcribe_audio(audio_path, api_key="test-key")
+        with pytest.raises(TranscriptionError, match=_ERR_TRANSCRIPTION_FAILED):
+            transcribe_audio(audio_path, api_key="test-key", no_cache=True)
 
-    @patch("src.core.transcriber.genai")
-    def test_transcribe_different_language(self, mock_genai, temp_output_dir):
+    def test_transcribe_different_language(self, monkeypatch, fake_audio_path):
         """Test transcription with different language setting."""
-        audio_path = temp_output_dir / "test.mp3"
-        audio_path.write_bytes(b"fake audio content")
+        mock_genai = MagicMock()
+        monkeypatch.setattr("src.core.transcriber.genai", mock_genai)
+        audio_path = fake_audio_path
 
         mock_file = MagicMock()
         mock_genai.upload_file.return_value = mock_file
@@ -158,6 +147,7 @@ class TestTranscribeAudio:
             audio_path,
             api_key="test-key",
             language="zh",
+            no_cache=True,
         )
 
         # Verify the prompt includes the language